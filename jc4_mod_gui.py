@@ -7,15 +7,233 @@ A streamlined workflow tool for JC4 vehicle modding using Protato's EasiEdit
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import os
+import sys
+import re
+import mmap
 import subprocess
-import xml.etree.ElementTree as ET
+try:
+    import lxml.etree as ET
+    HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAVE_LXML = False
 from pathlib import Path
 import json
-import shutil
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+import hashlib
 import threading
-from protato_integration import ProtatoIntegration, ProtatoProgressDialog
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from protato_integration import ProtatoIntegration, ProtatoProgressDialog, fast_copy, temp_path_beside
+
+CONFIG_FILE = "jc4_mod_config.json"
+EE_EXT = '.ee'
+DEPLOYED_PREFIX = '✅ '
+
+# Quick vehicle mods: vehicle_misc <misc name="..."> -> new value (also written to z_default)
+_VEHICLE_MISC_MODS = {
+    "official_top_speed": "1500",
+    "full_nitro_refill_time": "1",
+    "full_nitro_refill_time_lvl2": "0.005",
+    "full_nitro_use_time": "12000",
+    "full_nitro_use_time_upgraded": "15000",
+    "full_nitro_use_time_upgraded_lvl2": "22000",
+    "turbo_jump_cooldown": "0.5",
+    "turbo_jump_cooldown_upgraded": "0.005"
+}
+_TARGET_NAMES = frozenset(_VEHICLE_MISC_MODS)
+_MISC_XPATH = ".//misc"
+
+# Byte-level rewrite of the same elements, used to patch files without parsing them
+_VEHICLE_MISC_MODS_B = {name.encode(): value.encode() for name, value in _VEHICLE_MISC_MODS.items()}
+_MOD_NAMES_RE = b'|'.join(re.escape(name) for name in _VEHICLE_MISC_MODS_B)
+_QUICK_MOD_PATTERN = re.compile(rb'<misc\s+name="(' + _MOD_NAMES_RE + rb')"([^>]*)(?<!/)>[^<]*</misc>')
+_QUICK_MOD_NAME_PATTERN = re.compile(rb'\sname="(?:' + _MOD_NAMES_RE + rb')"')
+_Z_DEFAULT_PATTERN = re.compile(rb'\bz_default="[^"]*"')
+# Fixed pieces of each rewritten element: (opening tag start, z_default attribute, value and closing tag)
+_LINE_TEMPLATE = {
+    name: (b'<misc name="' + name + b'"', b'z_default="' + value + b'"', b'>' + value + b'</misc>')
+    for name, value in _VEHICLE_MISC_MODS_B.items()
+}
+
+
+def _json_loads(data):
+    """Decode JSON bytes, using orjson when it is available"""
+    if HAVE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    """Encode obj as indented JSON bytes with sorted keys"""
+    if HAVE_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, indent=4, sort_keys=True).encode('utf-8')
+
+
+def _xml_parser():
+    """Create a parser for vehicle XML (lxml parsers must not be shared between threads)"""
+    if HAVE_LXML:
+        return ET.XMLParser(remove_blank_text=False, huge_tree=True)
+    return ET.XMLParser()
+
+
+def _parse_xml_string(content):
+    """Parse XML text and return the root element"""
+    # Parse bytes - lxml rejects str input that carries an encoding declaration
+    return ET.fromstring(content.encode('utf-8'), _xml_parser())
+
+
+# XML tab contents are prefetched only for files up to this size, and up to this much in total
+_PREFETCH_MAX_BYTES = 1 << 20
+_PREFETCH_BUDGET_BYTES = 16 << 20
+
+# Seconds a vehicle listing is reused; EE files added inside a vehicle folder
+# do not change the type folder mtime, so only the TTL picks those up
+_VEHICLE_LIST_TTL = 5.0
+
+
+@lru_cache(maxsize=32)
+def _list_vehicles_cached(type_path, mtime_ns, ttl_bucket):
+    """List (vehicle, vehicle_path, ee_entries) for every vehicle folder with EE files
+    
+    mtime_ns and ttl_bucket are only part of the cache key, so the listing is
+    re-read whenever vehicles are added to or removed from type_path, and at
+    least every _VEHICLE_LIST_TTL seconds otherwise.
+    """
+    vehicles = []
+    with os.scandir(type_path) as it:
+        vehicle_entries = sorted(it, key=lambda entry: entry.name)
+    
+    for vehicle_entry in vehicle_entries:
+        if vehicle_entry.is_dir(follow_symlinks=False):
+            # Names and paths of the .ee files collected in one directory read
+            with os.scandir(vehicle_entry.path) as it:
+                ee_entries = tuple((entry.name, entry.path) for entry in it
+                                   if entry.name.endswith(EE_EXT) and entry.is_file(follow_symlinks=False))
+            if ee_entries:
+                vehicles.append((vehicle_entry.name, vehicle_entry.path, ee_entries))
+    return tuple(vehicles)
+
+
+def _iter_backup_files(path):
+    """Recursively yield the paths of .ee.backup files under path (unreadable folders are skipped, as os.walk does)"""
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_backup_files(entry.path)
+            elif entry.name.endswith('.ee.backup') and entry.is_file(follow_symlinks=False):
+                yield entry.path
+
+
+def _apply_misc_mods(xml_path, modifications):
+    """Stream-parse an XML file, applying modifications to the matching <misc> elements
+    
+    Only the targeted elements are touched while parsing; returns the document root.
+    """
+    if HAVE_LXML:
+        events = ET.iterparse(xml_path, events=('start', 'end'), huge_tree=True)
+    else:
+        events = ET.iterparse(xml_path, events=('start', 'end'))
+    
+    targets = _TARGET_NAMES if modifications is _VEHICLE_MISC_MODS else frozenset(modifications)
+    root = None
+    for event, elem in events:
+        if root is None:
+            root = elem
+        elif event == 'end' and elem.tag == 'misc':
+            name = elem.get("name")
+            if name in targets:
+                value = modifications[name]
+                elem.text = value
+                elem.set("z_default", value)
+    return root
+
+
+def _quick_mod_repl(match):
+    """Rebuild one matched <misc> element with its quick-mod value, keeping other attributes"""
+    head, z_default, tail = _LINE_TEMPLATE[match.group(1)]
+    attrs, count = _Z_DEFAULT_PATTERN.subn(z_default, match.group(2))
+    if not count:
+        attrs += b' ' + z_default
+    return head + attrs + tail
+
+
+def _patch_misc_bytes(data):
+    """Apply the quick mods to raw vehicle_misc XML bytes
+    
+    Returns None if any targeted element is not in the expected
+    <misc name="...">value</misc> shape, so the caller can fall back to parsing.
+    """
+    new_data, count = _QUICK_MOD_PATTERN.subn(_quick_mod_repl, data)
+    if count != len(_QUICK_MOD_NAME_PATTERN.findall(data)):
+        return None
+    return new_data
+
+
+@contextmanager
+def _atomic_path(path):
+    """Yield a temporary path to write to; it replaces path once the block completes"""
+    # A unique name beside the target keeps os.replace on one volume and lets concurrent writers coexist
+    tmp_path = temp_path_beside(path)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def _write_atomic(path, data):
+    """Write bytes or text to path through a temporary file, so a crash never leaves it half-written"""
+    with _atomic_path(path) as tmp_path:
+        if isinstance(data, str):
+            f = open(tmp_path, 'w', encoding='utf-8')
+        else:
+            f = open(tmp_path, 'wb')
+        with f:
+            f.write(data)
+
+
+def _apply_quick_mods_to_file(xml_path):
+    """Apply the quick mods to one vehicle_misc file, reading it through a memory map"""
+    with open(xml_path, 'rb') as f:
+        if not os.fstat(f.fileno()).st_size:
+            # Nothing to parse (and mmap rejects empty files) - report it as a failure
+            raise ValueError("no element found: file is empty")
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            new_data = _patch_misc_bytes(mm)
+            if new_data is not None and len(new_data) == len(mm) and mm[:] == new_data:
+                return  # Already modded
+    
+    # The map and file are closed before replacing the file (required on Windows)
+    if new_data is None:
+        # Unexpected element layout - fall back to parsing the document and
+        # serializing it straight to the file
+        root = _apply_misc_mods(xml_path, _VEHICLE_MISC_MODS)
+        with _atomic_path(xml_path) as tmp_path:
+            ET.ElementTree(root).write(tmp_path, encoding='utf-8')
+    else:
+        _write_atomic(xml_path, new_data)
+
 
 class JC4ModMakerGUI:
+    # Parsed config keyed by (path, mtime_ns) so unchanged files are not re-read
+    _config_cache = {}
+    # (mtime_ns, blake2b digest) of the config file contents last read or written, by path
+    _config_digest = {}
+    
     def __init__(self, root):
         self.root = root
         self.root.title("JC4 Mod Maker - Vehicle Editor")
@@ -25,9 +243,22 @@ class JC4ModMakerGUI:
         self.config = self.load_config()
         self.current_vehicle = None
         self.current_xml_files = []
+        self._vehicle_misc_files = []  # The vehicle_misc subset of current_xml_files
         self.protato_path = self.config.get("protato_path", "")
         self.vehicles_path = self.config.get("vehicles_path", "")
         self.deployed_vehicles = set()  # Track deployed vehicles for highlighting
+        self._refreshing = False  # Guards against overlapping XML folder scans
+        self._refresh_pending = False  # A refresh was requested mid-scan; rerun it once the scan lands
+        self._load_pending = None  # Pending debounced load_vehicles call
+        
+        # Protato jobs run one at a time on a shared worker and reuse one progress dialog
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='protato')
+        self._progress = None
+        self._active_tasks = set()  # Futures of queued or running jobs, cancelled on exit
+        self._closing = False
+        self._xml_cache = {}  # Prefetched XML tab contents by path
+        self._widget_dirty = {}  # Whether each loaded XML tab has unsaved edits, by path
+        self._quick_mod_stamps = {}  # (mtime_ns, size) of files last left fully modded, by path
         
         # Initialize Protato integration
         if self.protato_path and os.path.exists(self.protato_path):
@@ -36,10 +267,21 @@ class JC4ModMakerGUI:
             self.protato = None
         
         self.setup_ui()
-        
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+    def on_close(self):
+        """Stop background work and any running Protato instance, then exit"""
+        self._closing = True
+        # Queued jobs must not start once the window is gone (cancel_futures needs Python 3.9)
+        for future in self._active_tasks:
+            future.cancel()
+        if self.protato:
+            self.protato.close()
+        self._executor.shutdown(wait=False)
+        self.root.destroy()
+    
     def load_config(self):
         """Load configuration from file"""
-        config_file = "jc4_mod_config.json"
         default_config = {
             "protato_path": "/mnt/c/Users/iamty/Downloads/jc4 mod maker/protato/Protatos EasiEdit v05.exe",
             "vehicles_path": "C:\\Users\\iamty\\Downloads\\Compressed\\jc4mods\\mods vehicles\\amphibious vehicles v2\\dropzone\\editor\\entities\\vehicles",
@@ -47,23 +289,35 @@ class JC4ModMakerGUI:
             "protato_packed": "/mnt/c/Users/iamty/Downloads/jc4 mod maker/protato/Packed Files"
         }
         
-        if os.path.exists(config_file):
-            try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                    # Merge with defaults for any missing keys
-                    for key, value in default_config.items():
-                        if key not in config:
-                            config[key] = value
-                    return config
-            except:
-                return default_config
-        else:
+        try:
+            st = os.stat(CONFIG_FILE)
+        except OSError:
             self.save_config(default_config)
             return default_config
+        
+        # Reuse the parsed config while the file is unchanged on disk
+        cache_key = (CONFIG_FILE, st.st_mtime_ns)
+        cached = self._config_cache.get(cache_key)
+        if cached is not None:
+            return cached.copy()
+        
+        try:
+            with open(CONFIG_FILE, 'rb') as f:
+                raw = f.read()
+            config = _json_loads(raw)
+            self._config_digest[CONFIG_FILE] = (st.st_mtime_ns, hashlib.blake2b(raw, digest_size=16).digest())
+            # Merge with defaults for any missing keys
+            for key, value in default_config.items():
+                if key not in config:
+                    config[key] = value
+        except:
+            return default_config
+        
+        self._config_cache[cache_key] = config
+        return config.copy()
     
     def save_config(self, config=None):
-        """Save configuration to file"""
+        """Save configuration to file (skipped when the contents are unchanged)"""
         if config is None:
             config = {
                 "protato_path": self.protato_path,
@@ -72,8 +326,23 @@ class JC4ModMakerGUI:
                 "protato_packed": self.config.get("protato_packed")
             }
         
-        with open("jc4_mod_config.json", 'w') as f:
-            json.dump(config, f, indent=4)
+        payload = _json_dumps(config)
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        
+        # Compare against the digest of the file as last seen, without re-reading it
+        try:
+            current = (os.stat(CONFIG_FILE).st_mtime_ns, digest)
+        except OSError:
+            current = None
+        if current is not None and self._config_digest.get(CONFIG_FILE) == current:
+            return
+        
+        # Write to a temporary file and swap it in so the config is never left half-written
+        _write_atomic(CONFIG_FILE, payload)
+        
+        self._config_digest[CONFIG_FILE] = (os.stat(CONFIG_FILE).st_mtime_ns, digest)
+        # Drop cached copies of the previous file contents
+        self._config_cache.clear()
         
     def setup_ui(self):
         """Setup the main UI"""
@@ -112,14 +381,17 @@ class JC4ModMakerGUI:
         vehicle_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         self.vehicle_tree = ttk.Treeview(vehicle_frame)
-        vehicle_scrollbar = ttk.Scrollbar(vehicle_frame, orient=tk.VERTICAL, command=self.vehicle_tree.yview)
-        self.vehicle_tree.configure(yscrollcommand=vehicle_scrollbar.set)
+        self.vehicle_scrollbar = ttk.Scrollbar(vehicle_frame, orient=tk.VERTICAL, command=self.vehicle_tree.yview)
+        self.vehicle_tree.configure(yscrollcommand=self.vehicle_scrollbar.set)
         
         self.vehicle_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        vehicle_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.vehicle_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         self.vehicle_tree.bind('<<TreeviewSelect>>', self.on_vehicle_select)
         
+        # Configure highlighting for deployed items
+        self.vehicle_tree.tag_configure('deployed', background='lightgreen', foreground='darkgreen')
+        
         # Right panel - XML Editor
         right_frame = ttk.LabelFrame(main_frame, text="XML Editor")
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
@@ -165,6 +437,7 @@ class JC4ModMakerGUI:
         # XML file tabs
         self.xml_notebook = ttk.Notebook(right_frame)
         self.xml_notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.xml_notebook.bind('<<NotebookTabChanged>>', self._on_tab_selected)
         
         # Status bar
         self.status_var = tk.StringVar()
@@ -178,24 +451,34 @@ class JC4ModMakerGUI:
     
     def create_menu(self):
         """Create the application menu"""
+        # (menu label, [(item label, command) or None for a separator])
+        menus = [
+            ("File", [
+                ("Settings", self.show_settings),
+                None,
+                ("Exit", self.on_close),
+            ]),
+            ("Tools", [
+                ("Open Protato's EasiEdit", self.open_protato),
+                ("Open Vehicles Folder", self.open_vehicles_folder),
+                None,
+                ("Clear Deployed Status", self.clear_deployed_status),
+                ("Restore Original Files", self.restore_original_files),
+            ]),
+        ]
+        
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
         
-        # File menu
-        file_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(label="Settings", command=self.show_settings)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
-        
-        # Tools menu
-        tools_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Tools", menu=tools_menu)
-        tools_menu.add_command(label="Open Protato's EasiEdit", command=self.open_protato)
-        tools_menu.add_command(label="Open Vehicles Folder", command=self.open_vehicles_folder)
-        tools_menu.add_separator()
-        tools_menu.add_command(label="Clear Deployed Status", command=self.clear_deployed_status)
-        tools_menu.add_command(label="Restore Original Files", command=self.restore_original_files)
+        for menu_label, items in menus:
+            menu = tk.Menu(menubar, tearoff=0)
+            menubar.add_cascade(label=menu_label, menu=menu)
+            for item in items:
+                if item is None:
+                    menu.add_separator()
+                else:
+                    label, command = item
+                    menu.add_command(label=label, command=command)
     
     def show_settings(self):
         """Show settings dialog"""
@@ -235,6 +518,8 @@ class JC4ModMakerGUI:
             self.save_config()
             
             # Reinitialize Protato integration
+            if self.protato:
+                self.protato.close()
             if self.protato_path and os.path.exists(self.protato_path):
                 self.protato = ProtatoIntegration(self.protato_path)
             else:
@@ -266,6 +551,7 @@ class JC4ModMakerGUI:
         if folder:
             self.vehicles_path = folder
             self.save_config()
+            self.clear_cache()
             self.load_vehicle_types()
     
     def load_vehicle_types(self):
@@ -273,70 +559,89 @@ class JC4ModMakerGUI:
         if not self.vehicles_path or not os.path.exists(self.vehicles_path):
             return
         
-        types = []
-        for item in os.listdir(self.vehicles_path):
-            if os.path.isdir(os.path.join(self.vehicles_path, item)):
-                types.append(item)
+        with os.scandir(self.vehicles_path) as it:
+            types = sorted(entry.name for entry in it if entry.is_dir(follow_symlinks=False))
         
-        self.vehicle_type['values'] = sorted(types)
+        self.vehicle_type['values'] = types
         if types:
             self.vehicle_type.set(types[0])
-            self.load_vehicles()
+            self._load_vehicles_impl()
     
     def load_vehicles(self, event=None):
-        """Load vehicles for selected type"""
+        """Load vehicles for selected type, coalescing rapid selection changes"""
+        if self._load_pending:
+            self.root.after_cancel(self._load_pending)
+        self._load_pending = self.root.after(120, self._load_vehicles_impl)
+    
+    def _load_vehicles_impl(self):
+        """Rebuild the vehicle tree for the selected type"""
+        self._load_pending = None
         self.vehicle_tree.delete(*self.vehicle_tree.get_children())
         
         if not self.vehicle_type.get() or not self.vehicles_path:
             return
         
         type_path = os.path.join(self.vehicles_path, self.vehicle_type.get())
-        if not os.path.exists(type_path):
+        try:
+            type_mtime_ns = os.stat(type_path).st_mtime_ns
+        except FileNotFoundError:
             return
         
-        for vehicle in sorted(os.listdir(type_path)):
-            vehicle_path = os.path.join(type_path, vehicle)
-            if os.path.isdir(vehicle_path):
-                # Check for .ee files
-                ee_files = [f for f in os.listdir(vehicle_path) if f.endswith('.ee')]
-                if ee_files:
-                    # Check if any EE files from this vehicle have been deployed
-                    is_deployed = any(ee_file.replace('.ee', '') in self.deployed_vehicles for ee_file in ee_files)
-                    
-                    # Set the display text based on deployment status
-                    display_text = f"✅ {vehicle}" if is_deployed else vehicle
-                    item_id = self.vehicle_tree.insert('', tk.END, text=display_text, values=[vehicle_path])
-                    
-                    # Apply green highlighting if deployed
-                    if is_deployed:
-                        try:
-                            self.vehicle_tree.item(item_id, tags=('deployed',))
-                        except:
-                            pass
-                    
-                    for ee_file in ee_files:
-                        # Check if this specific EE file was deployed
-                        ee_name = ee_file.replace('.ee', '')
-                        is_ee_deployed = ee_name in self.deployed_vehicles
-                        
-                        # Set display text based on deployment status
-                        ee_display_text = f"✅ {ee_file}" if is_ee_deployed else ee_file
-                        ee_item_id = self.vehicle_tree.insert(item_id, tk.END, text=ee_display_text, values=[os.path.join(vehicle_path, ee_file)])
-                        
-                        if is_ee_deployed:
-                            try:
-                                self.vehicle_tree.item(ee_item_id, tags=('deployed',))
-                            except:
-                                pass
+        # Local snapshots keep attribute lookups out of the insert loop
+        deployed = frozenset(self.deployed_vehicles)
+        insert = self.vehicle_tree.insert
+        listing = _list_vehicles_cached(type_path, type_mtime_ns, int(time.monotonic() // _VEHICLE_LIST_TTL))
         
-        # Configure highlighting for deployed items
+        # Unmap the tree while inserting so it is only drawn once all rows exist
+        self.vehicle_tree.pack_forget()
         try:
-            self.vehicle_tree.tag_configure('deployed', background='lightgreen', foreground='darkgreen')
-        except:
-            pass
+            for vehicle, vehicle_path, ee_entries in listing:
+                # EE names without the extension
+                ee_names = [name[:-len(EE_EXT)] for name, path in ee_entries]
+                
+                # Check if any EE files from this vehicle have been deployed
+                deployed_here = deployed.intersection(ee_names)
+                is_deployed = bool(deployed_here)
+                
+                # Set the display text and green highlighting based on deployment status
+                display_text = DEPLOYED_PREFIX + vehicle if is_deployed else vehicle
+                tags = ('deployed',) if is_deployed else ()
+                item_id = insert('', tk.END, text=display_text, values=[vehicle_path], tags=tags)
+                
+                for (ee_file, ee_path), ee_name in zip(ee_entries, ee_names):
+                    # Check if this specific EE file was deployed
+                    is_ee_deployed = ee_name in deployed_here
+                    
+                    ee_display_text = DEPLOYED_PREFIX + ee_file if is_ee_deployed else ee_file
+                    ee_tags = ('deployed',) if is_ee_deployed else ()
+                    insert(item_id, tk.END, text=ee_display_text, values=[ee_path], tags=ee_tags)
+        finally:
+            self.vehicle_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, before=self.vehicle_scrollbar)
         
         self.status_var.set(f"Loaded {len(self.vehicle_tree.get_children())} vehicles")
     
+    def _apply_deployed_highlighting(self):
+        """Update the deployed marker on the existing vehicle rows without re-reading the folder"""
+        deployed = frozenset(self.deployed_vehicles)
+        tree = self.vehicle_tree
+        for item_id in tree.get_children():
+            is_deployed = False
+            for child_id in tree.get_children(item_id):
+                ee_file = os.path.basename(tree.item(child_id, 'values')[0])
+                is_ee_deployed = ee_file[:-len(EE_EXT)] in deployed
+                is_deployed = is_deployed or is_ee_deployed
+                
+                ee_display_text = DEPLOYED_PREFIX + ee_file if is_ee_deployed else ee_file
+                tree.item(child_id, text=ee_display_text, tags=('deployed',) if is_ee_deployed else ())
+            
+            vehicle = os.path.basename(tree.item(item_id, 'values')[0])
+            display_text = DEPLOYED_PREFIX + vehicle if is_deployed else vehicle
+            tree.item(item_id, text=display_text, tags=('deployed',) if is_deployed else ())
+    
+    def clear_cache(self):
+        """Forget cached vehicle listings so the next load re-reads the vehicles folder"""
+        _list_vehicles_cached.cache_clear()
+    
     def on_vehicle_select(self, event):
         """Handle vehicle selection"""
         selection = self.vehicle_tree.selection()
@@ -348,15 +653,14 @@ class JC4ModMakerGUI:
         
         if values:
             path = values[0]
-            if path.endswith('.ee'):
+            if path.endswith(EE_EXT):
                 self.current_vehicle = path
                 self.status_var.set(f"Selected: {os.path.basename(path)}")
             else:
                 # It's a folder, get all .ee files
-                ee_files = []
-                for f in os.listdir(path):
-                    if f.endswith('.ee'):
-                        ee_files.append(os.path.join(path, f))
+                with os.scandir(path) as it:
+                    ee_files = [entry.path for entry in it
+                                if entry.name.endswith(EE_EXT) and entry.is_file(follow_symlinks=False)]
                 self.current_vehicle = ee_files
                 self.status_var.set(f"Selected folder with {len(ee_files)} EE files")
     
@@ -370,24 +674,15 @@ class JC4ModMakerGUI:
             messagebox.showwarning("Warning", "Please select a single EE file first")
             return
         
-        def conversion_thread():
-            progress_dialog = None
-            try:
-                progress_dialog = ProtatoProgressDialog(self.root, "File to XML Conversion")
-                xml_files = self.protato.file_to_xml(self.current_vehicle, progress_dialog.update_status)
-                
-                if not progress_dialog.is_cancelled():
-                    # Use root.after to safely update GUI from thread
-                    self.root.after(0, lambda: self.refresh_xml_files())
-                    self.root.after(0, lambda: self.status_var.set(f"File to XML complete. Generated {len(xml_files)} XML files."))
-                    
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"File to XML conversion failed: {str(e)}"))
-            finally:
-                if progress_dialog:
-                    self.root.after(0, lambda: progress_dialog.close())
+        ee_file = self.current_vehicle
         
-        threading.Thread(target=conversion_thread, daemon=True).start()
+        def on_success(xml_files):
+            self.refresh_xml_files()
+            self.status_var.set(f"File to XML complete. Generated {len(xml_files)} XML files.")
+        
+        self._run_protato_task("File to XML Conversion",
+                               lambda callback: self.protato.file_to_xml(ee_file, callback),
+                               on_success, "Error", "File to XML conversion failed")
     
     def multi_file_to_xml(self):
         """Convert multiple EE files to XML using Protato's tool"""
@@ -401,23 +696,13 @@ class JC4ModMakerGUI:
         
         ee_files = self.current_vehicle if isinstance(self.current_vehicle, list) else [self.current_vehicle]
         
-        def conversion_thread():
-            progress_dialog = None
-            try:
-                progress_dialog = ProtatoProgressDialog(self.root, "Multi-file to XML Conversion")
-                xml_files = self.protato.multi_file_to_xml(ee_files, progress_dialog.update_status)
-                
-                if not progress_dialog.is_cancelled():
-                    self.root.after(0, lambda: self.refresh_xml_files())
-                    self.root.after(0, lambda: self.status_var.set(f"Multi-file to XML complete. Generated {len(xml_files)} XML files."))
-                    
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Multi-file to XML conversion failed: {str(e)}"))
-            finally:
-                if progress_dialog:
-                    self.root.after(0, lambda: progress_dialog.close())
+        def on_success(xml_files):
+            self.refresh_xml_files()
+            self.status_var.set(f"Multi-file to XML complete. Generated {len(xml_files)} XML files.")
         
-        threading.Thread(target=conversion_thread, daemon=True).start()
+        self._run_protato_task("Multi-file to XML Conversion",
+                               lambda callback: self.protato.multi_file_to_xml(ee_files, callback),
+                               on_success, "Error", "Multi-file to XML conversion failed")
     
     def xml_to_file(self):
         """Convert XML directory back to EE file using Protato's tool"""
@@ -464,26 +749,16 @@ class JC4ModMakerGUI:
                 return
             xml_dir = selected_dir
         
-        def conversion_thread():
-            progress_dialog = None
-            try:
-                progress_dialog = ProtatoProgressDialog(self.root, "XML to File Conversion")
-                ee_file = self.protato.xml_to_file(xml_dir, progress_dialog.update_status)
-                
-                if not progress_dialog.is_cancelled():
-                    if ee_file and os.path.exists(ee_file):
-                        self.root.after(0, lambda: self.status_var.set(f"XML to file complete. Generated: {os.path.basename(ee_file)}"))
-                        self.root.after(0, lambda: messagebox.showinfo("Success", f"EE file created: {os.path.basename(ee_file)}"))
-                    else:
-                        self.root.after(0, lambda: messagebox.showwarning("Warning", "EE file was not created successfully"))
-                    
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"XML to file conversion failed: {str(e)}"))
-            finally:
-                if progress_dialog:
-                    self.root.after(0, lambda: progress_dialog.close())
+        def on_success(ee_file):
+            if ee_file and os.path.exists(ee_file):
+                self.status_var.set(f"XML to file complete. Generated: {os.path.basename(ee_file)}")
+                messagebox.showinfo("Success", f"EE file created: {os.path.basename(ee_file)}")
+            else:
+                messagebox.showwarning("Warning", "EE file was not created successfully")
         
-        threading.Thread(target=conversion_thread, daemon=True).start()
+        self._run_protato_task("XML to File Conversion",
+                               lambda callback: self.protato.xml_to_file(xml_dir, callback),
+                               on_success, "Error", "XML to file conversion failed")
     
     def multi_xml_to_file(self):
         """Convert all XML directories back to EE files using Protato's tool"""
@@ -496,23 +771,12 @@ class JC4ModMakerGUI:
             messagebox.showwarning("Warning", "No XML directories found in Protato's To Edit folder")
             return
         
-        def conversion_thread():
-            progress_dialog = None
-            try:
-                progress_dialog = ProtatoProgressDialog(self.root, "Multi-XML to File Conversion")
-                ee_files = self.protato.multi_xml_to_file(progress_dialog.update_status)
-                
-                if not progress_dialog.is_cancelled():
-                    self.root.after(0, lambda: self.status_var.set(f"Multi-XML to file complete. Generated {len(ee_files)} EE files."))
-                    self.root.after(0, lambda: messagebox.showinfo("Success", f"Generated {len(ee_files)} EE files in Packed Files folder"))
-                    
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Multi-XML to file conversion failed: {str(e)}"))
-            finally:
-                if progress_dialog:
-                    self.root.after(0, lambda: progress_dialog.close())
+        def on_success(ee_files):
+            self.status_var.set(f"Multi-XML to file complete. Generated {len(ee_files)} EE files.")
+            messagebox.showinfo("Success", f"Generated {len(ee_files)} EE files in Packed Files folder")
         
-        threading.Thread(target=conversion_thread, daemon=True).start()
+        self._run_protato_task("Multi-XML to File Conversion", self.protato.multi_xml_to_file,
+                               on_success, "Error", "Multi-XML to file conversion failed")
     
     def deploy_modified_files(self):
         """Deploy modified EE files from Packed Files back to original vehicle locations"""
@@ -567,70 +831,182 @@ class JC4ModMakerGUI:
         button_frame = ttk.Frame(deploy_dialog)
         button_frame.pack(fill=tk.X, padx=20, pady=10)
         
+        def on_success(deployed):
+            # Update deployed vehicles tracking
+            self.deployed_vehicles.update(deployed)
+            
+            # Refresh the vehicle tree to show highlighting
+            self._load_vehicles_impl()
+            
+            # Show success message
+            success_msg = f"🎉 Successfully deployed {len(deployed)} vehicles!\n\n"
+            success_msg += "Modified EE files have been copied to their original locations.\n"
+            success_msg += "Original files backed up with .backup extension.\n\n"
+            success_msg += "Deployed vehicles are now highlighted in green."
+            
+            messagebox.showinfo("Deployment Complete", success_msg)
+            self.status_var.set(f"Deployed {len(deployed)} vehicles successfully")
+        
         def do_deploy():
             deploy_dialog.destroy()
             
-            def deployment_thread():
-                progress_dialog = None
-                try:
-                    progress_dialog = ProtatoProgressDialog(self.root, "Deploying Modified Files")
-                    deployed = self.protato.deploy_modified_files(self.vehicles_path, progress_dialog.update_status)
-                    
-                    if not progress_dialog.is_cancelled():
-                        # Update deployed vehicles tracking
-                        self.deployed_vehicles.update(deployed)
-                        
-                        # Refresh the vehicle tree to show highlighting
-                        self.root.after(0, lambda: self.load_vehicles())
-                        
-                        # Show success message
-                        success_msg = f"🎉 Successfully deployed {len(deployed)} vehicles!\n\n"
-                        success_msg += "Modified EE files have been copied to their original locations.\n"
-                        success_msg += "Original files backed up with .backup extension.\n\n"
-                        success_msg += "Deployed vehicles are now highlighted in green."
-                        
-                        self.root.after(0, lambda: messagebox.showinfo("Deployment Complete", success_msg))
-                        self.root.after(0, lambda: self.status_var.set(f"Deployed {len(deployed)} vehicles successfully"))
-                
-                except Exception as e:
-                    self.root.after(0, lambda: messagebox.showerror("Deployment Error", f"Deployment failed: {str(e)}"))
-                finally:
-                    if progress_dialog:
-                        self.root.after(0, lambda: progress_dialog.close())
-            
-            threading.Thread(target=deployment_thread, daemon=True).start()
+            vehicles_path = self.vehicles_path
+            self._run_protato_task("Deploying Modified Files",
+                                   lambda callback: self.protato.deploy_modified_files(vehicles_path, callback),
+                                   on_success, "Deployment Error", "Deployment failed")
         
         ttk.Button(button_frame, text="🚀 Deploy All", command=do_deploy).pack(side=tk.RIGHT, padx=(5, 0))
         ttk.Button(button_frame, text="Cancel", command=deploy_dialog.destroy).pack(side=tk.RIGHT)
     
+    def _show_progress(self, title):
+        """Show the shared progress dialog, creating it if it does not exist yet"""
+        if self._progress is None or self._progress.is_closed():
+            self._progress = ProtatoProgressDialog(self.root, title)
+        else:
+            self._progress.show(title)
+        return self._progress
+    
+    def _run_protato_task(self, title, task, on_success, error_title, error_message):
+        """Run task(callback) on the Protato worker thread while the progress dialog is shown
+        
+        on_success(result) and any error dialog run on the UI thread once the task finishes.
+        """
+        progress_dialog = self._show_progress(title)
+        future = self._executor.submit(task, progress_dialog.update_status)
+        self._active_tasks.add(future)
+        
+        def done(f):
+            # The Tk interpreter is gone once closing has started
+            if not self._closing:
+                self.root.after(0, self._on_task_done, f, progress_dialog, on_success, error_title, error_message)
+        
+        future.add_done_callback(done)
+    
+    def _on_task_done(self, future, progress_dialog, on_success, error_title, error_message):
+        """Hide the progress dialog and report the outcome of a Protato task"""
+        if self._closing:
+            return
+        self._active_tasks.discard(future)
+        cancelled = progress_dialog.is_cancelled()
+        if not cancelled and not self._active_tasks:
+            progress_dialog.hide()
+        
+        try:
+            result = future.result()
+        except Exception as e:
+            messagebox.showerror(error_title, f"{error_message}: {str(e)}")
+            return
+        
+        if not cancelled:
+            on_success(result)
+    
     def refresh_xml_files(self):
         """Find and load XML files from Protato's To Edit folder (filtered for vehicle_misc only)"""
         if not self.protato:
             return
-            
-        # Clear existing tabs
-        for tab in self.xml_notebook.tabs():
-            self.xml_notebook.forget(tab)
-        
-        self.current_xml_files = []
+        if self._refreshing:
+            self._refresh_pending = True
+            return
         
-        # Look for XML files (filter for vehicle_misc_esi.xml only)
-        to_edit_path = self.protato.to_edit_dir
-        if os.path.exists(to_edit_path):
-            for root, dirs, files in os.walk(to_edit_path):
-                for file in files:
-                    if file.endswith('.xml') and 'vehicle_misc_esi' in file:
-                        xml_path = os.path.join(root, file)
-                        self.current_xml_files.append(xml_path)
-                        self.create_xml_tab(xml_path)
+        self._refreshing = True
+        self._xml_cache.clear()
+        self.status_var.set("Scanning for vehicle_misc XML files...")
         
-        self.status_var.set(f"Loaded {len(self.current_xml_files)} vehicle_misc XML files")
+        def scan_thread():
+            try:
+                paths = self._scan_xml_files()
+            except Exception:
+                paths = []
+            self.root.after(0, self._apply_xml_files, paths)
+            # Warm file contents on this thread, off the Protato queue, so opening a tab is instant
+            budget = _PREFETCH_BUDGET_BYTES
+            for path in paths:
+                budget -= self._prefetch_xml(path, budget)
+                if budget <= 0:
+                    break
+        
+        threading.Thread(target=scan_thread, daemon=True).start()
+    
+    def _scan_xml_files(self):
+        """Walk the To Edit folder and return vehicle_misc XML paths (runs off the UI thread)"""
+        to_edit_path = Path(self.protato.to_edit_dir)
+        if not to_edit_path.exists():
+            return []
+        return [str(xml_path) for xml_path in to_edit_path.rglob('*vehicle_misc_esi*.xml')]
+    
+    def _apply_xml_files(self, xml_paths):
+        """Replace the XML tabs with the scanned files (runs on the UI thread)"""
+        try:
+            # Clear existing tabs
+            for tab in self.xml_notebook.tabs():
+                self.xml_notebook.forget(tab)
+            
+            self.current_xml_files = []
+            self._vehicle_misc_files = []
+            for xml_path in xml_paths:
+                self.current_xml_files.append(xml_path)
+                name = os.path.basename(xml_path)
+                if 'vehicle_misc' in name:
+                    self._vehicle_misc_files.append(xml_path)
+                self.create_xml_tab(xml_path, name)
+            self._on_tab_selected()
+            
+            self.status_var.set(f"Loaded {len(self.current_xml_files)} vehicle_misc XML files")
+        finally:
+            self._refreshing = False
+            if self._refresh_pending:
+                # Files may have changed after this scan started
+                self._refresh_pending = False
+                self.refresh_xml_files()
     
-    def create_xml_tab(self, xml_path):
-        """Create a new tab for XML editing"""
+    def create_xml_tab(self, xml_path, name=None):
+        """Create a new tab for XML editing (contents are loaded when the tab is first shown)"""
         tab_frame = ttk.Frame(self.xml_notebook)
+        tab_frame._xml_path = xml_path
+        tab_frame._loaded = False
+        self.xml_notebook.add(tab_frame, text=name or os.path.basename(xml_path))
+    
+    def _on_tab_selected(self, event=None):
+        """Populate the selected XML tab the first time it is shown"""
+        selected = self.xml_notebook.select()
+        if not selected:
+            return
+        
+        tab_frame = self.xml_notebook.nametowidget(selected)
+        if not getattr(tab_frame, '_loaded', True):
+            tab_frame._loaded = True
+            self._load_xml_tab(tab_frame, tab_frame._xml_path)
+    
+    def _prefetch_xml(self, xml_path, budget):
+        """Read a small XML file into the prefetch cache, returning the bytes used (runs on the scan thread)"""
+        try:
+            with open(xml_path, 'r', encoding='utf-8') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > min(_PREFETCH_MAX_BYTES, budget):
+                    return 0  # Large files are read when their tab is opened
+                self._xml_cache[xml_path] = f.read()
+                return size
+        except (OSError, UnicodeDecodeError):
+            return 0  # The tab reads the file itself and reports the error
+    
+    def _xml_text_chunks(self, xml_path, chunk_size=65536):
+        """Yield the text of an XML file in chunks, preferring prefetched content"""
+        content = self._xml_cache.pop(xml_path, None)
+        if content is not None:
+            for start in range(0, len(content), chunk_size):
+                yield content[start:start + chunk_size]
+            return
+        
+        with open(xml_path, 'r', encoding='utf-8', buffering=1 << 20) as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+    
+    def _load_xml_tab(self, tab_frame, xml_path):
+        """Build the editor widgets for an XML tab and load the file into them"""
         filename = os.path.basename(xml_path)
-        self.xml_notebook.add(tab_frame, text=filename)
         
         # Text editor with syntax highlighting (basic)
         text_frame = ttk.Frame(tab_frame)
@@ -639,13 +1015,20 @@ class JC4ModMakerGUI:
         text_widget = scrolledtext.ScrolledText(text_frame, wrap=tk.NONE, font=("Consolas", 10))
         text_widget.pack(fill=tk.BOTH, expand=True)
         
-        # Load XML content
+        # Load XML content in 64 KiB chunks, letting the window redraw between them
         try:
-            with open(xml_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                text_widget.insert(tk.END, content)
+            for chunk in self._xml_text_chunks(xml_path):
+                text_widget.insert(tk.END, chunk)
+                text_widget.update_idletasks()
         except Exception as e:
             text_widget.insert(tk.END, f"Error loading file: {str(e)}")
+        text_widget.edit_modified(False)
+        
+        def on_modified(event):
+            self._widget_dirty[xml_path] = text_widget.edit_modified()
+        
+        text_widget.bind('<<Modified>>', on_modified)
+        self._widget_dirty[xml_path] = False
         
         # Save button
         button_frame = ttk.Frame(tab_frame)
@@ -654,8 +1037,8 @@ class JC4ModMakerGUI:
         def save_xml():
             try:
                 content = text_widget.get(1.0, tk.END)
-                with open(xml_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                _write_atomic(xml_path, content)
+                text_widget.edit_modified(False)
                 messagebox.showinfo("Success", f"Saved {filename}")
                 self.status_var.set(f"Saved {filename}")
             except Exception as e:
@@ -666,37 +1049,36 @@ class JC4ModMakerGUI:
         # If this is a vehicle_misc file, add quick mod button
         if 'vehicle_misc' in filename:
             ttk.Button(button_frame, text="Apply Quick Vehicle Mods", 
-                      command=lambda: self.apply_vehicle_misc_mods(text_widget)).pack(side=tk.LEFT, padx=(5, 0))
+                      command=lambda: self.apply_vehicle_misc_mods(text_widget, xml_path)).pack(side=tk.LEFT, padx=(5, 0))
     
-    def apply_vehicle_misc_mods(self, text_widget):
+    def apply_vehicle_misc_mods(self, text_widget, xml_path=None):
         """Apply quick modifications to vehicle_misc_esi.xml"""
         try:
-            content = text_widget.get(1.0, tk.END)
-            
-            # Parse XML
-            root = ET.fromstring(content)
+            # An unedited tab matches the file on disk, so it can be parsed from there
+            clean = xml_path is not None and not self._widget_dirty.get(xml_path, True)
             
-            # Apply modifications
-            modifications = {
-                "official_top_speed": "1500",
-                "full_nitro_refill_time": "1",
-                "full_nitro_refill_time_lvl2": "0.005",
-                "full_nitro_use_time": "12000",
-                "full_nitro_use_time_upgraded": "15000",
-                "full_nitro_use_time_upgraded_lvl2": "22000",
-                "turbo_jump_cooldown": "0.5",
-                "turbo_jump_cooldown_upgraded": "0.005"
-            }
-            
-            for misc in root.findall(".//misc"):
-                name = misc.get("name")
-                if name in modifications:
-                    misc.text = modifications[name]
-                    misc.set("z_default", modifications[name])
-            
-            # Update text widget
-            text_widget.delete(1.0, tk.END)
-            text_widget.insert(1.0, ET.tostring(root, encoding='unicode'))
+            # Patch just the targeted lines; only reparse the whole document
+            # if an element isn't laid out on a single line
+            if not self._patch_misc_lines(text_widget):
+                if clean:
+                    root = _apply_misc_mods(xml_path, _VEHICLE_MISC_MODS)
+                else:
+                    content = text_widget.get(1.0, tk.END)
+                    
+                    # Parse XML
+                    root = _parse_xml_string(content)
+                    
+                    # Apply modifications
+                    for misc in root.findall(_MISC_XPATH):
+                        name = misc.get("name")
+                        if name not in _TARGET_NAMES:
+                            continue
+                        value = _VEHICLE_MISC_MODS[name]
+                        misc.text = value
+                        misc.set("z_default", value)
+                
+                # Update text widget in a single edit (one re-layout instead of two)
+                text_widget.replace(1.0, tk.END, ET.tostring(root, encoding='unicode'))
             
             messagebox.showinfo("Success", "Applied quick vehicle modifications!")
             self.status_var.set("Applied quick mods to vehicle_misc")
@@ -704,45 +1086,65 @@ class JC4ModMakerGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to apply modifications: {str(e)}")
     
+    def _patch_misc_lines(self, text_widget):
+        """Rewrite the targeted <misc> lines in the Text widget in place
+        
+        Returns False if a line could not be patched on its own.
+        """
+        for name in _VEHICLE_MISC_MODS:
+            index = '1.0'
+            while True:
+                index = text_widget.search(f'name="{name}"', index, tk.END)
+                if not index:
+                    break
+                
+                line_start, line_end = f'{index} linestart', f'{index} lineend'
+                line = text_widget.get(line_start, line_end)
+                new_line = _patch_misc_bytes(line.encode('utf-8'))
+                if new_line is None:
+                    return False
+                
+                new_line = new_line.decode('utf-8')
+                if new_line != line:
+                    text_widget.replace(line_start, line_end, new_line)
+                index = f'{index} lineend'
+        return True
+    
     def apply_quick_mods(self):
         """Apply quick mods to all relevant XML files"""
         if not self.current_xml_files:
             messagebox.showwarning("Warning", "No XML files loaded")
             return
         
+        misc_files = self._vehicle_misc_files
+        self.status_var.set("Applying quick mods...")
+        
+        def task(callback):
+            callback(f"Applying quick mods to {len(misc_files)} files...")
+            # Files are independent, so overlap their IO across a few workers
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as executor:
+                return list(executor.map(self._quick_mod_one, misc_files))
+        
+        # Queued on the Protato worker so it never overlaps a conversion clearing To Edit, or another pass
+        self._run_protato_task("Applying Quick Mods", task, self._quick_mods_done,
+                               "Error", "Applying quick mods failed")
+    
+    def _quick_mods_done(self, results):
+        """Report quick mod results (runs on the UI thread)"""
         modified_count = 0
-        for xml_path in self.current_xml_files:
-            if 'vehicle_misc' in os.path.basename(xml_path):
-                try:
-                    with open(xml_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    root = ET.fromstring(content)
-                    
-                    modifications = {
-                        "official_top_speed": "1500",
-                        "full_nitro_refill_time": "1",
-                        "full_nitro_refill_time_lvl2": "0.005",
-                        "full_nitro_use_time": "12000",
-                        "full_nitro_use_time_upgraded": "15000",
-                        "full_nitro_use_time_upgraded_lvl2": "22000",
-                        "turbo_jump_cooldown": "0.5",
-                        "turbo_jump_cooldown_upgraded": "0.005"
-                    }
-                    
-                    for misc in root.findall(".//misc"):
-                        name = misc.get("name")
-                        if name in modifications:
-                            misc.text = modifications[name]
-                            misc.set("z_default", modifications[name])
-                    
-                    with open(xml_path, 'w', encoding='utf-8') as f:
-                        f.write(ET.tostring(root, encoding='unicode'))
-                    
-                    modified_count += 1
-                    
-                except Exception as e:
-                    messagebox.showwarning("Warning", f"Failed to modify {xml_path}: {str(e)}")
+        failures = []
+        for xml_path, ok, err in results:
+            if ok:
+                modified_count += 1
+            else:
+                failures.append((xml_path, err))
+        
+        if failures:
+            # One summary dialog instead of a modal popup per file
+            lines = [f"Failed to modify {xml_path}: {err}" for xml_path, err in failures[:10]]
+            if len(failures) > 10:
+                lines.append(f"...and {len(failures) - 10} more")
+            messagebox.showwarning("Warning", "\n".join(lines))
         
         messagebox.showinfo("Success", f"Applied quick mods to {modified_count} files!")
         self.status_var.set(f"Applied quick mods to {modified_count} files")
@@ -750,6 +1152,19 @@ class JC4ModMakerGUI:
         # Refresh XML tabs
         self.refresh_xml_files()
     
+    def _quick_mod_one(self, xml_path):
+        """Apply quick mods to a single file, returning (path, ok, error)"""
+        try:
+            # Skip files untouched since the last run already left them modded
+            st = os.stat(xml_path)
+            if self._quick_mod_stamps.get(xml_path) != (st.st_mtime_ns, st.st_size):
+                _apply_quick_mods_to_file(xml_path)
+                st = os.stat(xml_path)
+                self._quick_mod_stamps[xml_path] = (st.st_mtime_ns, st.st_size)
+            return xml_path, True, None
+        except Exception as e:
+            return xml_path, False, str(e)
+    
     
     def open_protato(self):
         """Open Protato's EasiEdit"""
@@ -765,7 +1180,12 @@ class JC4ModMakerGUI:
         """Open vehicles folder"""
         if self.vehicles_path and os.path.exists(self.vehicles_path):
             try:
-                subprocess.Popen(['explorer', self.vehicles_path])
+                if hasattr(os, 'startfile'):
+                    # ShellExecute reuses a running Explorer instead of spawning explorer.exe
+                    os.startfile(self.vehicles_path)
+                else:
+                    opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+                    subprocess.Popen([opener, self.vehicles_path])
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to open vehicles folder: {str(e)}")
         else:
@@ -775,7 +1195,7 @@ class JC4ModMakerGUI:
         """Clear the deployed status highlighting"""
         if messagebox.askyesno("Clear Deployed Status", "This will clear the green highlighting from all vehicles.\n\nContinue?"):
             self.deployed_vehicles.clear()
-            self.load_vehicles()
+            self._apply_deployed_highlighting()
             self.status_var.set("Deployed status cleared")
     
     def restore_original_files(self):
@@ -785,11 +1205,7 @@ class JC4ModMakerGUI:
             return
         
         # Find backup files
-        backup_files = []
-        for root, dirs, files in os.walk(self.vehicles_path):
-            for file in files:
-                if file.endswith('.ee.backup'):
-                    backup_files.append(os.path.join(root, file))
+        backup_files = list(_iter_backup_files(self.vehicles_path))
         
         if not backup_files:
             messagebox.showinfo("Info", "No backup files found to restore.")
@@ -801,22 +1217,44 @@ class JC4ModMakerGUI:
                                    "overwrite any modifications.\n\nContinue?")
         
         if result:
-            restored = 0
-            for backup_file in backup_files:
+            self.status_var.set("Restoring original files...")
+            
+            def restore_one(backup_file):
                 try:
                     original_file = backup_file.replace('.backup', '')
                     if os.path.exists(original_file):
-                        shutil.copy2(backup_file, original_file)
-                        restored += 1
+                        # Copied alongside, then swapped in, so the game file is never left half-written
+                        tmp_path = temp_path_beside(original_file)
+                        try:
+                            fast_copy(backup_file, tmp_path)
+                            os.replace(tmp_path, original_file)
+                        except BaseException:
+                            Path(tmp_path).unlink(missing_ok=True)
+                            raise
+                        return True
                 except Exception as e:
                     print(f"Failed to restore {backup_file}: {str(e)}")
+                return False
             
-            # Clear deployed status since files are restored
-            self.deployed_vehicles.clear()
-            self.load_vehicles()
+            def task(callback):
+                callback(f"Restoring {len(backup_files)} original files...")
+                # Copies are independent, so let the kernel overlap them
+                with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+                    return sum(executor.map(restore_one, backup_files))
             
-            messagebox.showinfo("Restore Complete", f"Restored {restored} original files from backups.")
-            self.status_var.set(f"Restored {restored} original files")
+            # Queued on the Protato worker so it never overlaps a deploy writing the same EE files
+            self._run_protato_task("Restoring Original Files", task, self._restore_done,
+                                   "Restore Error", "Restore failed")
+    
+    def _restore_done(self, restored):
+        """Finish a restore (runs on the UI thread)"""
+        # Clear deployed status since files are restored (restoring only
+        # overwrites existing EE files, so the listing itself is unchanged)
+        self.deployed_vehicles.clear()
+        self._apply_deployed_highlighting()
+        
+        messagebox.showinfo("Restore Complete", f"Restored {restored} original files from backups.")
+        self.status_var.set(f"Restored {restored} original files")
 
 
 def main():
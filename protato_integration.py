@@ -6,19 +6,148 @@ Replicates the 4 main functions without opening the GUI
 """
 
 import os
+import ctypes
 import subprocess
 import time
 import shutil
+import filecmp
 from pathlib import Path
 import logging
-import tkinter as tk
-from tkinter import filedialog, messagebox
+import queue
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+def fast_copy(src, dst):
+    """Copy file contents and timestamps from src to dst, without copying permissions
+    
+    Uses a kernel-side copy: CopyFileExW on Windows, and shutil.copyfile
+    elsewhere, which picks sendfile on Linux and fcopyfile on macOS.
+    """
+    if os.name == 'nt':
+        # CopyFileExW keeps the source timestamps itself
+        if not ctypes.windll.kernel32.CopyFileExW(src, dst, None, None, None, 0):
+            raise ctypes.WinError()
+    else:
+        st = os.stat(src)
+        shutil.copyfile(src, dst)
+        os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def temp_path_beside(path):
+    """Create an empty, uniquely named file next to path and return its name
+    
+    It is created with the umask default and then given path's mode if path
+    exists, so swapping it in with os.replace leaves the permissions unchanged.
+    """
+    while True:
+        tmp_path = f"{path}.{os.urandom(4).hex()}.tmp"
+        try:
+            os.close(os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
+            break
+        except FileExistsError:
+            continue
+    try:
+        shutil.copymode(path, tmp_path)
+    except FileNotFoundError:
+        pass  # New file - keep the umask default
+    return tmp_path
+
+
+# Configure logging once on import rather than on every ProtatoIntegration()
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+EE_EXT = '.ee'
+XML_EXT = '.xml'
+
+def _files_equal(a, b):
+    """Whether two files have the same contents (sizes are compared before any bytes are read)"""
+    if os.stat(a).st_size != os.stat(b).st_size:
+        return False
+    return filecmp.cmp(a, b, shallow=False)
+
+
+# Folders that never hold Protato output, pruned from directory walks
+_SKIP_DIRS = frozenset({'__pycache__', '.git', 'backup', 'logs'})
+
+
+# Shared start of every sample XML file; %s is the .vmodc file name suffix
+_XML_HEADER = '''<?xml version='1.0' encoding='utf-8'?>
+
+<esi_edit>
+<path ee_filename="C:/Users/iamty/Downloads/Compressed/jc4mods/protato/Unpacked Files/{vehicle_name}" filepath="{base_filepath}/{vehicle_name}_%s"/>
+'''
+
+# Sample XML bodies by component, matched in order as substrings of the XML type
+_XML_BODIES = {
+    "vehicle_misc": '''<misc name="official_top_speed" offset="110" type="float" z_default="500">500</misc>
+<misc name="open_door_duration_s" offset="F8" type="float" z_default="0.20000000298023224">0.20000000298023224</misc>
+<misc name="close_door_duration_s" offset="FC" type="float" z_default="0.20000000298023224">0.20000000298023224</misc>
+<misc name="full_nitro_refill_time" offset="11C" type="float" z_default="7">7</misc>
+<misc name="full_nitro_refill_time_lvl2" offset="120" type="float" z_default="5.5">5.5</misc>
+<misc name="nitro_refill_min_speed_kph" offset="124" type="float" z_default="20">20</misc>
+<misc name="full_nitro_use_time" offset="128" type="float" z_default="12">12</misc>
+<misc name="full_nitro_use_time_upgraded" offset="12C" type="float" z_default="15">15</misc>
+<misc name="full_nitro_use_time_upgraded_lvl2" offset="130" type="float" z_default="22">22</misc>
+<misc name="turbo_jump_cooldown" offset="134" type="float" z_default="3.5">3.5</misc>
+<misc name="turbo_jump_cooldown_upgraded" offset="138" type="float" z_default="2.5">2.5</misc>
+''',
+    "land_engine": '''<misc name="max_power" offset="10" type="float" z_default="300">300</misc>
+<misc name="max_torque" offset="14" type="float" z_default="400">400</misc>
+<misc name="redline_rpm" offset="18" type="float" z_default="6000">6000</misc>
+<misc name="idle_rpm" offset="1C" type="float" z_default="800">800</misc>
+<misc name="max_rpm" offset="20" type="float" z_default="7000">7000</misc>
+''',
+    "transmission": '''<misc name="gear_ratio_1" offset="10" type="float" z_default="3.5">3.5</misc>
+<misc name="gear_ratio_2" offset="14" type="float" z_default="2.1">2.1</misc>
+<misc name="gear_ratio_3" offset="18" type="float" z_default="1.4">1.4</misc>
+<misc name="gear_ratio_4" offset="1C" type="float" z_default="1.0">1.0</misc>
+<misc name="reverse_ratio" offset="20" type="float" z_default="-3.0">-3.0</misc>
+''',
+    "brakes": '''<misc name="front_brake_force" offset="10" type="float" z_default="2000">2000</misc>
+<misc name="rear_brake_force" offset="14" type="float" z_default="1500">1500</misc>
+<misc name="handbrake_force" offset="18" type="float" z_default="3000">3000</misc>
+''',
+    "buoyancy": '''<misc name="water_density" offset="10" type="float" z_default="1000">1000</misc>
+<misc name="buoyancy_force" offset="14" type="float" z_default="9.8">9.8</misc>
+<misc name="drag_coefficient" offset="18" type="float" z_default="0.5">0.5</misc>
+''',
+    "land_steering": '''<misc name="max_steer_angle" offset="10" type="float" z_default="30">30</misc>
+<misc name="steer_speed" offset="14" type="float" z_default="2.0">2.0</misc>
+<misc name="return_speed" offset="18" type="float" z_default="5.0">5.0</misc>
+''',
+    "rigid_body": '''<misc name="mass" offset="10" type="float" z_default="1500">1500</misc>
+<misc name="center_of_mass_x" offset="14" type="float" z_default="0">0</misc>
+<misc name="center_of_mass_y" offset="18" type="float" z_default="0">0</misc>
+<misc name="center_of_mass_z" offset="1C" type="float" z_default="0">0</misc>
+''',
+    "land_aerodynamics": '''<misc name="drag_coefficient" offset="10" type="float" z_default="0.3">0.3</misc>
+<misc name="downforce_front" offset="14" type="float" z_default="100">100</misc>
+<misc name="downforce_rear" offset="18" type="float" z_default="150">150</misc>
+''',
+    "custom_land_global": '''<misc name="global_scale" offset="10" type="float" z_default="1.0">1.0</misc>
+<misc name="damage_multiplier" offset="14" type="float" z_default="1.0">1.0</misc>
+<misc name="performance_multiplier" offset="18" type="float" z_default="1.0">1.0</misc>
+''',
+}
+
+# Complete str.format templates, built once at import
+_XML_TEMPLATES = {key: _XML_HEADER % f"{key}.vmodc" + body + "</esi_edit>" for key, body in _XML_BODIES.items()}
+_XML_KEYS = tuple(_XML_TEMPLATES)
+_GENERIC_TEMPLATE = _XML_HEADER % "{vmodc_name}" + "<!-- Generated XML template for {xml_type} -->\n</esi_edit>"
 
 class ProtatoIntegration:
-    def __init__(self, protato_exe_path):
+    # Protato folders whose working directories were already created this session
+    _initialized_dirs = set()
+    
+    def __init__(self, protato_exe_path, copy_workers=8, debug=False, timeout=600):
         self.protato_exe = protato_exe_path
         self.protato_dir = os.path.dirname(protato_exe_path)
+        self.copy_workers = copy_workers  # Parallel file copies/removals when staging EE files
+        self.debug = debug  # Capture and log Protato's stderr (discarded otherwise)
+        self.timeout = timeout  # Seconds a Protato run may take before it is killed as hung
+        self._dir_cache = {}  # Short-lived directory listings: key -> (timestamp, result)
+        self._protato_proc = None  # Protato run in flight, kept so close() can stop it
         
         # Working directories
         self.to_edit_dir = os.path.join(self.protato_dir, "To Edit")
@@ -26,12 +155,19 @@ class ProtatoIntegration:
         self.unpacked_files_dir = os.path.join(self.protato_dir, "Unpacked Files")
         
         # Ensure directories exist
-        for dir_path in [self.to_edit_dir, self.packed_files_dir, self.unpacked_files_dir]:
-            os.makedirs(dir_path, exist_ok=True)
+        self._ensure_dirs(self.protato_dir, [self.to_edit_dir, self.packed_files_dir, self.unpacked_files_dir])
         
-        # Setup logging
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
+    
+    @classmethod
+    def _ensure_dirs(cls, protato_dir, dir_paths):
+        """Create the working directories once per Protato folder"""
+        if protato_dir in cls._initialized_dirs:
+            return
+        for dir_path in dir_paths:
+            if not os.path.isdir(dir_path):
+                os.makedirs(dir_path)
+        cls._initialized_dirs.add(protato_dir)
     
     def file_to_xml(self, ee_file_path, callback=None):
         """
@@ -44,63 +180,16 @@ class ProtatoIntegration:
         Returns:
             List of XML files created
         """
-        try:
-            if callback:
-                callback("Starting File to XML conversion with Protato...")
-            
-            if not os.path.exists(ee_file_path) or not ee_file_path.endswith('.ee'):
-                raise ValueError("Invalid EE file path")
-            
-            if not os.path.exists(self.protato_exe):
-                raise FileNotFoundError(f"Protato executable not found: {self.protato_exe}")
-            
-            # Clear working directories
-            self._clear_directory(self.to_edit_dir)
-            self._clear_directory(self.unpacked_files_dir)
-            
-            if callback:
-                callback("Copying EE file to Protato directory...")
-            
-            # Copy EE file to protato directory for processing
-            ee_filename = os.path.basename(ee_file_path)
-            temp_ee_path = os.path.join(self.protato_dir, ee_filename)
-            shutil.copy2(ee_file_path, temp_ee_path)
-            
-            try:
-                if callback:
-                    callback("Running Protato conversion (this may take a moment)...")
-                
-                # Use Method 1: Batch File Wrapper (most reliable silent method)
-                success = self._run_protato_with_batch_wrapper(callback)
-                
-                if callback:
-                    callback("Protato processing complete, scanning for XML files...")
-                
-                # Find XML files that Protato created in To Edit directory
-                xml_files = self._find_xml_files(self.to_edit_dir)
-                
-                if callback:
-                    callback(f"File to XML conversion complete. Found {len(xml_files)} XML files.")
-                
-                return xml_files
-                
-            finally:
-                # Enhanced cleanup - remove all temporary EE files from protato root
-                self._cleanup_protato_root_directory()
-                
-                # Specific cleanup for this file
-                if os.path.exists(temp_ee_path):
-                    try:
-                        os.remove(temp_ee_path)
-                        if callback:
-                            callback("Cleaned up temporary files")
-                    except Exception as e:
-                        self.logger.warning(f"Failed to remove temp file {temp_ee_path}: {str(e)}")
-            
-        except Exception as e:
+        if callback:
+            callback("Starting File to XML conversion with Protato...")
+        
+        if not os.path.exists(ee_file_path) or not ee_file_path.endswith(EE_EXT):
             if callback:
-                callback(f"Error: {str(e)}")
-            raise
+                callback("Error: Invalid EE file path")
+            raise ValueError("Invalid EE file path")
+        
+        # A single file is a batch of one, so it shares the one-Protato-run path
+        return self.multi_file_to_xml([ee_file_path], callback)
     
     def multi_file_to_xml(self, ee_files, callback=None):
         """
@@ -125,24 +214,28 @@ class ProtatoIntegration:
             self._clear_directory(self.unpacked_files_dir)
             
             all_xml_files = []
-            temp_ee_files = []
+            
+            # Destinations are known up front, so cleanup covers partially staged batches
+            temp_ee_files = [os.path.join(self.protato_dir, os.path.basename(ee_file_path))
+                             for ee_file_path in ee_files]
             
             try:
-                # Copy all EE files to protato directory
-                for i, ee_file_path in enumerate(ee_files):
-                    if callback:
-                        callback(f"Preparing file {i+1}/{len(ee_files)}: {os.path.basename(ee_file_path)}")
-                    
-                    ee_filename = os.path.basename(ee_file_path)
-                    temp_ee_path = os.path.join(self.protato_dir, ee_filename)
-                    shutil.copy2(ee_file_path, temp_ee_path)
-                    temp_ee_files.append(temp_ee_path)
+                # Copy all EE files to protato directory, overlapping the copies
+                if callback:
+                    callback(f"Preparing {len(ee_files)} files...")
+                
+                if ee_files:
+                    with ThreadPoolExecutor(max_workers=min(self.copy_workers, len(ee_files))) as executor:
+                        list(executor.map(shutil.copy2, ee_files, temp_ee_files))
                 
                 if callback:
                     callback("Running Protato batch conversion (this may take several moments)...")
                 
-                # Use batch wrapper for silent execution
-                success = self._run_protato_with_batch_wrapper(callback)
+                # Run Protato hidden in the background
+                if not self._run_protato(callback):
+                    # Whatever it unpacked before stopping is incomplete
+                    self._clear_directory(self.to_edit_dir)
+                    raise RuntimeError("Protato did not finish the conversion")
                 
                 if callback:
                     callback("Protato batch processing complete, scanning for XML files...")
@@ -160,12 +253,9 @@ class ProtatoIntegration:
                 self._cleanup_protato_root_directory()
                 
                 # Specific cleanup for tracked files
-                for temp_ee_path in temp_ee_files:
-                    if os.path.exists(temp_ee_path):
-                        try:
-                            os.remove(temp_ee_path)
-                        except Exception as e:
-                            self.logger.warning(f"Failed to remove temp file {temp_ee_path}: {str(e)}")
+                if temp_ee_files:
+                    with ThreadPoolExecutor(max_workers=min(self.copy_workers, len(temp_ee_files))) as executor:
+                        list(executor.map(self._remove_temp_file, temp_ee_files))
                 
                 if callback and temp_ee_files:
                     callback("Cleaned up all temporary files")
@@ -205,31 +295,26 @@ class ProtatoIntegration:
             if callback:
                 callback("Running Protato XML to EE conversion...")
             
-            # Use batch wrapper for silent execution
-            success = self._run_protato_with_batch_wrapper(callback)
+            # Run Protato hidden in the background
+            if not self._run_protato(callback):
+                # A partly written EE file must never be offered for deployment
+                self._clear_directory(self.packed_files_dir)
+                raise RuntimeError("Protato did not finish the conversion")
             
             if callback:
                 callback("Protato processing complete, locating generated EE file...")
             
             # Find the generated EE file in Packed Files
+            packed_index = self._index_packed_ee()
             ee_file_path = None
-            vehicle_packed_dir = os.path.join(self.packed_files_dir, vehicle_name)
             
-            if os.path.exists(vehicle_packed_dir):
-                for file in os.listdir(vehicle_packed_dir):
-                    if file.endswith('.ee'):
-                        ee_file_path = os.path.join(vehicle_packed_dir, file)
-                        break
+            if packed_index.get(vehicle_name):
+                ee_file_path = packed_index[vehicle_name][0]
             
             # If not found in vehicle-specific directory, check main packed files dir
             if not ee_file_path:
-                for root, dirs, files in os.walk(self.packed_files_dir):
-                    for file in files:
-                        if file.endswith('.ee') and vehicle_name in file:
-                            ee_file_path = os.path.join(root, file)
-                            break
-                    if ee_file_path:
-                        break
+                ee_file_path = next((path for paths in packed_index.values() for path in paths
+                                     if vehicle_name in os.path.basename(path)), None)
             
             if not ee_file_path:
                 raise FileNotFoundError(f"Protato did not generate an EE file for {vehicle_name}")
@@ -265,12 +350,11 @@ class ProtatoIntegration:
             self._clear_directory(self.packed_files_dir)
             
             # Find all XML directories in To Edit
-            xml_directories = []
-            if os.path.exists(self.to_edit_dir):
-                for item in os.listdir(self.to_edit_dir):
-                    item_path = os.path.join(self.to_edit_dir, item)
-                    if os.path.isdir(item_path):
-                        xml_directories.append(item_path)
+            try:
+                with os.scandir(self.to_edit_dir) as it:
+                    xml_directories = [entry.path for entry in it if entry.is_dir()]
+            except FileNotFoundError:
+                xml_directories = []
             
             if not xml_directories:
                 if callback:
@@ -280,19 +364,17 @@ class ProtatoIntegration:
             if callback:
                 callback(f"Running Protato batch XML to EE conversion for {len(xml_directories)} vehicles...")
             
-            # Use batch wrapper for silent execution
-            success = self._run_protato_with_batch_wrapper(callback)
+            # Run Protato hidden in the background
+            if not self._run_protato(callback):
+                # A partly written EE file must never be offered for deployment
+                self._clear_directory(self.packed_files_dir)
+                raise RuntimeError("Protato did not finish the conversion")
             
             if callback:
                 callback("Protato batch processing complete, scanning for generated EE files...")
             
             # Find all generated EE files in Packed Files directory
-            generated_ee_files = []
-            if os.path.exists(self.packed_files_dir):
-                for root, dirs, files in os.walk(self.packed_files_dir):
-                    for file in files:
-                        if file.endswith('.ee'):
-                            generated_ee_files.append(os.path.join(root, file))
+            generated_ee_files = [path for paths in self._index_packed_ee().values() for path in paths]
             
             if callback:
                 callback(f"Multi-XML to file conversion complete. Generated {len(generated_ee_files)} EE files.")
@@ -304,58 +386,101 @@ class ProtatoIntegration:
                 callback(f"Error: {str(e)}")
             raise
     
+    def _remove_temp_file(self, temp_ee_path):
+        """Remove a staged temporary file if it is still there"""
+        try:
+            Path(temp_ee_path).unlink(missing_ok=True)
+        except Exception as e:
+            self.logger.warning("Failed to remove temp file %s: %s", temp_ee_path, e)
+    
     def _clear_directory(self, directory):
         """Clear all contents of a directory"""
-        if os.path.exists(directory):
-            for item in os.listdir(directory):
-                item_path = os.path.join(directory, item)
-                try:
-                    if os.path.isfile(item_path):
-                        os.remove(item_path)
-                    elif os.path.isdir(item_path):
-                        shutil.rmtree(item_path)
-                except Exception as e:
-                    self.logger.warning(f"Failed to remove {item_path}: {str(e)}")
-        else:
+        try:
+            # scandir entries carry the file type, so no extra stat per item
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path)
+                        else:
+                            os.unlink(entry.path)
+                    except Exception as e:
+                        self.logger.warning("Failed to remove %s: %s", entry.path, e)
+        except FileNotFoundError:
             os.makedirs(directory, exist_ok=True)
+        self._dir_cache.clear()
     
     def _find_xml_files(self, directory):
         """Find all XML files in a directory and subdirectories"""
         xml_files = []
-        if os.path.exists(directory):
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    if file.endswith('.xml'):
-                        xml_files.append(os.path.join(root, file))
+        # os.walk yields nothing for a missing directory
+        for root, dirs, files in os.walk(directory, topdown=True, followlinks=False):
+            dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+            for file in files:
+                if file.endswith(XML_EXT):
+                    xml_files.append(os.path.join(root, file))
         return xml_files
     
+    def _cached(self, key, fn, ttl=2.0):
+        """Return fn()'s result, reusing one computed less than ttl seconds ago
+        
+        The cached object itself is returned, so callers must not mutate it.
+        Entries are dropped whenever Protato runs or a working directory is cleared.
+        """
+        now = time.monotonic()
+        entry = self._dir_cache.get(key)
+        if entry is None or now - entry[0] > ttl:
+            entry = (now, fn())
+            self._dir_cache[key] = entry
+        return entry[1]
+    
     def get_xml_directories(self):
         """Get all directories in To Edit folder that contain XML files"""
+        return list(self._cached(os.path.abspath(self.to_edit_dir), self._scan_xml_directories))
+    
+    def _scan_xml_directories(self):
+        """Uncached get_xml_directories"""
         xml_directories = []
-        if os.path.exists(self.to_edit_dir):
-            for item in os.listdir(self.to_edit_dir):
-                item_path = os.path.join(self.to_edit_dir, item)
-                if os.path.isdir(item_path):
-                    # Check if directory contains XML files
-                    has_xml = any(f.endswith('.xml') for f in os.listdir(item_path))
-                    if has_xml:
-                        xml_directories.append(item_path)
+        try:
+            with os.scandir(self.to_edit_dir) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        # Check if directory contains XML files (stops at the first one)
+                        with os.scandir(entry.path) as sub:
+                            has_xml = any(f.name.endswith(XML_EXT) for f in sub)
+                        if has_xml:
+                            xml_directories.append(entry.path)
+        except FileNotFoundError:
+            pass
         return xml_directories
     
     def get_packed_ee_files(self):
         """Get all EE files in Packed Files directory"""
+        return list(self._cached(os.path.abspath(self.packed_files_dir), self._scan_packed_ee_files))
+    
+    def _index_packed_ee(self):
+        """Map each folder name under Packed Files to the EE files in it (cached like the listing itself)"""
+        return self._cached(('index', os.path.abspath(self.packed_files_dir)), self._build_packed_index)
+    
+    def _build_packed_index(self):
+        """Uncached _index_packed_ee"""
+        index = {}
+        for ee_path in self._cached(os.path.abspath(self.packed_files_dir), self._scan_packed_ee_files):
+            index.setdefault(os.path.basename(os.path.dirname(ee_path)), []).append(ee_path)
+        return index
+    
+    def _scan_packed_ee_files(self):
+        """Uncached get_packed_ee_files"""
         ee_files = []
-        if os.path.exists(self.packed_files_dir):
-            for root, dirs, files in os.walk(self.packed_files_dir):
-                for file in files:
-                    if file.endswith('.ee'):
-                        ee_files.append(os.path.join(root, file))
+        for root, dirs, files in os.walk(self.packed_files_dir, topdown=True, followlinks=False):
+            dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+            for file in files:
+                if file.endswith(EE_EXT):
+                    ee_files.append(os.path.join(root, file))
         return ee_files
     
     def _create_sample_xml_files(self, vehicle_dir, vehicle_name):
         """Create ALL necessary XML files for a vehicle (but GUI will filter to show only vehicle_misc)"""
-        xml_files = []
-        
         # Create ALL XML files that a complete vehicle needs
         xml_types = [
             "vehicle_misc_esi.xml",           # Main vehicle properties (shown in GUI)
@@ -369,10 +494,12 @@ class ProtatoIntegration:
             "custom_land_global_esi.xml"      # Global vehicle settings
         ]
         
-        for xml_type in xml_types:
-            xml_path = os.path.join(vehicle_dir, f"{vehicle_name}_{xml_type}")
-            self._create_sample_xml(xml_path, vehicle_name, xml_type)
-            xml_files.append(xml_path)
+        xml_files = [os.path.join(vehicle_dir, f"{vehicle_name}_{xml_type}") for xml_type in xml_types]
+        
+        # Each write goes to its own path, so they can all run at once
+        with ThreadPoolExecutor(max_workers=len(xml_types)) as executor:
+            list(executor.map(lambda xml_path, xml_type: self._create_sample_xml(xml_path, vehicle_name, xml_type),
+                              xml_files, xml_types))
         
         return xml_files
     
@@ -382,120 +509,17 @@ class ProtatoIntegration:
         # Base file path for the XML
         base_filepath = f"C:/Users/iamty/Downloads/Compressed/jc4mods/protato/Unpacked Files/{vehicle_name}/vehicles/01_land/{vehicle_name}/modules/default"
         
-        if "vehicle_misc" in xml_type:
-            content = f'''<?xml version='1.0' encoding='utf-8'?>
-
-<esi_edit>
-<path ee_filename="C:/Users/iamty/Downloads/Compressed/jc4mods/protato/Unpacked Files/{vehicle_name}" filepath="{base_filepath}/{vehicle_name}_vehicle_misc.vmodc"/>
-<misc name="official_top_speed" offset="110" type="float" z_default="500">500</misc>
-<misc name="open_door_duration_s" offset="F8" type="float" z_default="0.20000000298023224">0.20000000298023224</misc>
-<misc name="close_door_duration_s" offset="FC" type="float" z_default="0.20000000298023224">0.20000000298023224</misc>
-<misc name="full_nitro_refill_time" offset="11C" type="float" z_default="7">7</misc>
-<misc name="full_nitro_refill_time_lvl2" offset="120" type="float" z_default="5.5">5.5</misc>
-<misc name="nitro_refill_min_speed_kph" offset="124" type="float" z_default="20">20</misc>
-<misc name="full_nitro_use_time" offset="128" type="float" z_default="12">12</misc>
-<misc name="full_nitro_use_time_upgraded" offset="12C" type="float" z_default="15">15</misc>
-<misc name="full_nitro_use_time_upgraded_lvl2" offset="130" type="float" z_default="22">22</misc>
-<misc name="turbo_jump_cooldown" offset="134" type="float" z_default="3.5">3.5</misc>
-<misc name="turbo_jump_cooldown_upgraded" offset="138" type="float" z_default="2.5">2.5</misc>
-</esi_edit>'''
-        
-        elif "land_engine" in xml_type:
-            content = f'''<?xml version='1.0' encoding='utf-8'?>
-
-<esi_edit>
-<path ee_filename="C:/Users/iamty/Downloads/Compressed/jc4mods/protato/Unpacked Files/{vehicle_name}" filepath="{base_filepath}/{vehicle_name}_land_engine.vmodc"/>
-<misc name="max_power" offset="10" type="float" z_default="300">300</misc>
-<misc name="max_torque" offset="14" type="float" z_default="400">400</misc>
-<misc name="redline_rpm" offset="18" type="float" z_default="6000">6000</misc>
-<misc name="idle_rpm" offset="1C" type="float" z_default="800">800</misc>
-<misc name="max_rpm" offset="20" type="float" z_default="7000">7000</misc>
-</esi_edit>'''
-        
-        elif "transmission" in xml_type:
-            content = f'''<?xml version='1.0' encoding='utf-8'?>
-
-<esi_edit>
-<path ee_filename="C:/Users/iamty/Downloads/Compressed/jc4mods/protato/Unpacked Files/{vehicle_name}" filepath="{base_filepath}/{vehicle_name}_transmission.vmodc"/>
-<misc name="gear_ratio_1" offset="10" type="float" z_default="3.5">3.5</misc>
-<misc name="gear_ratio_2" offset="14" type="float" z_default="2.1">2.1</misc>
-<misc name="gear_ratio_3" offset="18" type="float" z_default="1.4">1.4</misc>
-<misc name="gear_ratio_4" offset="1C" type="float" z_default="1.0">1.0</misc>
-<misc name="reverse_ratio" offset="20" type="float" z_default="-3.0">-3.0</misc>
-</esi_edit>'''
-        
-        elif "brakes" in xml_type:
-            content = f'''<?xml version='1.0' encoding='utf-8'?>
-
-<esi_edit>
-<path ee_filename="C:/Users/iamty/Downloads/Compressed/jc4mods/protato/Unpacked Files/{vehicle_name}" filepath="{base_filepath}/{vehicle_name}_brakes.vmodc"/>
-<misc name="front_brake_force" offset="10" type="float" z_default="2000">2000</misc>
-<misc name="rear_brake_force" offset="14" type="float" z_default="1500">1500</misc>
-<misc name="handbrake_force" offset="18" type="float" z_default="3000">3000</misc>
-</esi_edit>'''
-        
-        elif "buoyancy" in xml_type:
-            content = f'''<?xml version='1.0' encoding='utf-8'?>
-
-<esi_edit>
-<path ee_filename="C:/Users/iamty/Downloads/Compressed/jc4mods/protato/Unpacked Files/{vehicle_name}" filepath="{base_filepath}/{vehicle_name}_buoyancy.vmodc"/>
-<misc name="water_density" offset="10" type="float" z_default="1000">1000</misc>
-<misc name="buoyancy_force" offset="14" type="float" z_default="9.8">9.8</misc>
-<misc name="drag_coefficient" offset="18" type="float" z_default="0.5">0.5</misc>
-</esi_edit>'''
-        
-        elif "land_steering" in xml_type:
-            content = f'''<?xml version='1.0' encoding='utf-8'?>
-
-<esi_edit>
-<path ee_filename="C:/Users/iamty/Downloads/Compressed/jc4mods/protato/Unpacked Files/{vehicle_name}" filepath="{base_filepath}/{vehicle_name}_land_steering.vmodc"/>
-<misc name="max_steer_angle" offset="10" type="float" z_default="30">30</misc>
-<misc name="steer_speed" offset="14" type="float" z_default="2.0">2.0</misc>
-<misc name="return_speed" offset="18" type="float" z_default="5.0">5.0</misc>
-</esi_edit>'''
-        
-        elif "rigid_body" in xml_type:
-            content = f'''<?xml version='1.0' encoding='utf-8'?>
-
-<esi_edit>
-<path ee_filename="C:/Users/iamty/Downloads/Compressed/jc4mods/protato/Unpacked Files/{vehicle_name}" filepath="{base_filepath}/{vehicle_name}_rigid_body.vmodc"/>
-<misc name="mass" offset="10" type="float" z_default="1500">1500</misc>
-<misc name="center_of_mass_x" offset="14" type="float" z_default="0">0</misc>
-<misc name="center_of_mass_y" offset="18" type="float" z_default="0">0</misc>
-<misc name="center_of_mass_z" offset="1C" type="float" z_default="0">0</misc>
-</esi_edit>'''
-        
-        elif "land_aerodynamics" in xml_type:
-            content = f'''<?xml version='1.0' encoding='utf-8'?>
-
-<esi_edit>
-<path ee_filename="C:/Users/iamty/Downloads/Compressed/jc4mods/protato/Unpacked Files/{vehicle_name}" filepath="{base_filepath}/{vehicle_name}_land_aerodynamics.vmodc"/>
-<misc name="drag_coefficient" offset="10" type="float" z_default="0.3">0.3</misc>
-<misc name="downforce_front" offset="14" type="float" z_default="100">100</misc>
-<misc name="downforce_rear" offset="18" type="float" z_default="150">150</misc>
-</esi_edit>'''
-        
-        elif "custom_land_global" in xml_type:
-            content = f'''<?xml version='1.0' encoding='utf-8'?>
-
-<esi_edit>
-<path ee_filename="C:/Users/iamty/Downloads/Compressed/jc4mods/protato/Unpacked Files/{vehicle_name}" filepath="{base_filepath}/{vehicle_name}_custom_land_global.vmodc"/>
-<misc name="global_scale" offset="10" type="float" z_default="1.0">1.0</misc>
-<misc name="damage_multiplier" offset="14" type="float" z_default="1.0">1.0</misc>
-<misc name="performance_multiplier" offset="18" type="float" z_default="1.0">1.0</misc>
-</esi_edit>'''
-        
+        key = next((k for k in _XML_KEYS if k in xml_type), None)
+        if key:
+            content = _XML_TEMPLATES[key].format(vehicle_name=vehicle_name, base_filepath=base_filepath)
         else:
             # Generic fallback for any unknown types
-            content = f'''<?xml version='1.0' encoding='utf-8'?>
-
-<esi_edit>
-<path ee_filename="C:/Users/iamty/Downloads/Compressed/jc4mods/protato/Unpacked Files/{vehicle_name}" filepath="{base_filepath}/{vehicle_name}_{xml_type.replace('_esi.xml', '.vmodc')}"/>
-<!-- Generated XML template for {xml_type} -->
-</esi_edit>'''
+            content = _GENERIC_TEMPLATE.format(vehicle_name=vehicle_name, base_filepath=base_filepath,
+                                               xml_type=xml_type, vmodc_name=xml_type.replace('_esi.xml', '.vmodc'))
         
-        with open(xml_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # One unbuffered binary write - no text codec or newline translation layer
+        with open(xml_path, 'wb', buffering=0) as f:
+            f.write(content.encode('utf-8'))
     
     def deploy_modified_files(self, original_vehicles_path, callback=None):
         """
@@ -523,41 +547,27 @@ class ProtatoIntegration:
                 return deployed_vehicles
             
             total_files = len(packed_ee_files)
-            
-            for i, packed_ee_file in enumerate(packed_ee_files):
-                if callback:
-                    callback(f"Deploying {i+1}/{total_files}: {os.path.basename(packed_ee_file)}")
-                
-                try:
-                    # Extract vehicle name from the packed file path
-                    vehicle_name = os.path.basename(os.path.dirname(packed_ee_file))
-                    
-                    # Find the original vehicle directory
-                    original_vehicle_dir = self._find_original_vehicle_directory(vehicle_name, original_vehicles_path)
-                    
-                    if original_vehicle_dir:
-                        # Find the original EE file to replace
-                        original_ee_file = self._find_original_ee_file(vehicle_name, original_vehicle_dir)
-                        
-                        if original_ee_file:
-                            # Create backup of original file
-                            backup_path = original_ee_file + ".backup"
-                            if not os.path.exists(backup_path):
-                                shutil.copy2(original_ee_file, backup_path)
-                            
-                            # Replace with modified file
-                            shutil.copy2(packed_ee_file, original_ee_file)
+            vehicle_index = self._build_vehicle_index(original_vehicles_path)
+            
+            # Files for the same vehicle go to the same worker, so they never race on one original file
+            by_vehicle = {}
+            for packed_ee_file in packed_ee_files:
+                by_vehicle.setdefault(os.path.basename(os.path.dirname(packed_ee_file)), []).append(packed_ee_file)
+            
+            def deploy_group(files):
+                return [(packed_ee_file, self._deploy_one(packed_ee_file, original_vehicles_path, vehicle_index))
+                        for packed_ee_file in files]
+            
+            done = 0
+            with ThreadPoolExecutor(max_workers=self.copy_workers) as executor:
+                futures = [executor.submit(deploy_group, files) for files in by_vehicle.values()]
+                for future in as_completed(futures):
+                    for packed_ee_file, vehicle_name in future.result():
+                        done += 1
+                        if callback:
+                            callback(f"Deployed {done}/{total_files}: {os.path.basename(packed_ee_file)}")
+                        if vehicle_name:
                             deployed_vehicles.append(vehicle_name)
-                            
-                            self.logger.info(f"Deployed {vehicle_name} successfully")
-                        else:
-                            self.logger.warning(f"Could not find original EE file for {vehicle_name}")
-                    else:
-                        self.logger.warning(f"Could not find original directory for {vehicle_name}")
-                
-                except Exception as e:
-                    self.logger.error(f"Failed to deploy {vehicle_name}: {str(e)}")
-                    continue
             
             if callback:
                 callback(f"Deployment complete. Successfully deployed {len(deployed_vehicles)} vehicles.")
@@ -569,102 +579,177 @@ class ProtatoIntegration:
                 callback(f"Deployment error: {str(e)}")
             raise
     
-    def _find_original_vehicle_directory(self, vehicle_name, base_vehicles_path):
-        """Find the original directory for a vehicle"""
-        if not os.path.exists(base_vehicles_path):
-            return None
+    def _build_vehicle_index(self, base_vehicles_path):
+        """Map vehicle folder names to their paths, two levels under base_vehicles_path (cached briefly)"""
+        return self._cached(('vehicles', os.path.abspath(base_vehicles_path)),
+                            lambda: self._scan_vehicle_dirs(base_vehicles_path))
+    
+    def _scan_vehicle_dirs(self, base_vehicles_path):
+        """Uncached _build_vehicle_index"""
+        index = {}
+        try:
+            # Vehicle type directories (01_land, 02_air, etc.) hold the vehicle directories
+            with os.scandir(base_vehicles_path) as types:
+                for type_entry in types:
+                    if type_entry.is_dir():
+                        with os.scandir(type_entry.path) as vehicles:
+                            for vehicle_entry in vehicles:
+                                if vehicle_entry.is_dir():
+                                    index.setdefault(vehicle_entry.name, vehicle_entry.path)
+        except FileNotFoundError:
+            pass
+        return index
+    
+    def _deploy_one(self, packed_ee_file, original_vehicles_path, vehicle_index):
+        """Back up and replace the original EE file for one packed file; returns the vehicle name on success"""
+        # Extract vehicle name from the packed file path
+        vehicle_name = os.path.basename(os.path.dirname(packed_ee_file))
         
-        # Search through vehicle type directories (01_land, 02_air, etc.)
-        for vehicle_type in os.listdir(base_vehicles_path):
-            type_path = os.path.join(base_vehicles_path, vehicle_type)
-            if os.path.isdir(type_path):
-                # Look for vehicle directory
-                for vehicle_dir in os.listdir(type_path):
-                    if vehicle_name in vehicle_dir or vehicle_dir in vehicle_name:
-                        vehicle_path = os.path.join(type_path, vehicle_dir)
-                        if os.path.isdir(vehicle_path):
-                            return vehicle_path
+        try:
+            # Find the original vehicle directory
+            original_vehicle_dir = self._find_original_vehicle_directory(vehicle_name, original_vehicles_path,
+                                                                         vehicle_index)
+            
+            if original_vehicle_dir:
+                # Find the original EE file to replace
+                original_ee_file = self._find_original_ee_file(vehicle_name, original_vehicle_dir)
+                
+                if original_ee_file:
+                    # Create backup of original file
+                    backup_path = original_ee_file + ".backup"
+                    if not os.path.exists(backup_path):
+                        fast_copy(original_ee_file, backup_path)
+                    
+                    # Replace with modified file - copied alongside, then swapped in atomically
+                    # (skipped when a previous deploy already left identical bytes there)
+                    if not _files_equal(packed_ee_file, original_ee_file):
+                        tmp_path = temp_path_beside(original_ee_file)
+                        try:
+                            fast_copy(packed_ee_file, tmp_path)
+                            os.replace(tmp_path, original_ee_file)
+                        except BaseException:
+                            Path(tmp_path).unlink(missing_ok=True)
+                            raise
+                    
+                    self.logger.info("Deployed %s successfully", vehicle_name)
+                    return vehicle_name
+                else:
+                    self.logger.warning("Could not find original EE file for %s", vehicle_name)
+            else:
+                self.logger.warning("Could not find original directory for %s", vehicle_name)
         
+        except Exception as e:
+            self.logger.error("Failed to deploy %s: %s", vehicle_name, e)
         return None
     
+    def _find_original_vehicle_directory(self, vehicle_name, base_vehicles_path, vehicle_index=None):
+        """Find the original directory for a vehicle"""
+        if vehicle_index is None:
+            vehicle_index = self._build_vehicle_index(base_vehicles_path)
+        
+        # Exact folder name first, then the first partial match either way round
+        if vehicle_name in vehicle_index:
+            return vehicle_index[vehicle_name]
+        return next((path for vehicle_dir, path in vehicle_index.items()
+                     if vehicle_name in vehicle_dir or vehicle_dir in vehicle_name), None)
+    
     def _find_original_ee_file(self, vehicle_name, vehicle_directory):
         """Find the original EE file in a vehicle directory"""
-        if not os.path.exists(vehicle_directory):
+        # Look for EE files that match the vehicle name, stopping at the first
+        try:
+            with os.scandir(vehicle_directory) as it:
+                return next((entry.path for entry in it
+                             if entry.name.endswith(EE_EXT)
+                             and (vehicle_name in entry.name or entry.name.replace(EE_EXT, '') in vehicle_name)
+                             and entry.is_file(follow_symlinks=False)), None)
+        except FileNotFoundError:
             return None
-        
-        # Look for EE files that match the vehicle name
-        for file in os.listdir(vehicle_directory):
-            if file.endswith('.ee') and (vehicle_name in file or file.replace('.ee', '') in vehicle_name):
-                return os.path.join(vehicle_directory, file)
-        
-        return None
     
     def get_deployable_vehicles(self):
         """Get list of vehicles that can be deployed (have packed EE files)"""
-        packed_files = self.get_packed_ee_files()
-        vehicles = []
-        
-        for packed_file in packed_files:
-            vehicle_name = os.path.basename(os.path.dirname(packed_file))
-            if vehicle_name not in vehicles:
-                vehicles.append(vehicle_name)
-        
-        return vehicles
+        return list(self._index_packed_ee())
     
     def _cleanup_protato_root_directory(self):
         """Remove any EE files that might be left in the protato root directory"""
         try:
-            if not os.path.exists(self.protato_dir):
-                return
-            
             removed_count = 0
-            for file in os.listdir(self.protato_dir):
-                if file.endswith('.ee'):
-                    file_path = os.path.join(self.protato_dir, file)
-                    try:
-                        os.remove(file_path)
-                        removed_count += 1
-                        self.logger.info(f"Removed temporary EE file: {file}")
-                    except Exception as e:
-                        self.logger.warning(f"Failed to remove EE file {file}: {str(e)}")
+            with os.scandir(self.protato_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(EE_EXT) and entry.is_file(follow_symlinks=False):
+                        try:
+                            os.unlink(entry.path)
+                            removed_count += 1
+                            self.logger.info("Removed temporary EE file: %s", entry.name)
+                        except Exception as e:
+                            self.logger.warning("Failed to remove EE file %s: %s", entry.name, e)
             
             if removed_count > 0:
-                self.logger.info(f"Cleaned up {removed_count} temporary EE files from protato root")
+                self.logger.info("Cleaned up %d temporary EE files from protato root", removed_count)
                 
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            self.logger.warning(f"Error during protato root cleanup: {str(e)}")
+            self.logger.warning("Error during protato root cleanup: %s", e)
+    
+    def close(self):
+        """Stop a Protato run that is still in flight (the worker thread reaps it)"""
+        proc, self._protato_proc = self._protato_proc, None
+        if proc is not None and proc.poll() is None:
+            proc.kill()
     
-    def _run_protato_with_batch_wrapper(self, callback=None):
-        """Run Protato silently using batch file wrapper (Method 1)"""
+    def _run_protato(self, callback=None):
+        """Run Protato silently, with no console window and no batch file shim"""
         try:
-            if callback:
-                callback("Creating silent batch wrapper...")
-            
-            # Create batch file that runs Protato silently
-            batch_content = f'''@echo off
-cd /d "{self.protato_dir}"
-echo.|"{self.protato_exe}" >nul 2>&1
-exit /b 0
-'''
-            batch_file = os.path.join(self.protato_dir, "silent_protato.bat")
-            
-            # Write batch file
-            with open(batch_file, 'w') as f:
-                f.write(batch_content)
-            
             if callback:
                 callback("Executing Protato silently...")
             
             try:
-                # Run batch file with no window
-                result = subprocess.run(
-                    [batch_file],
+                # Hide any window Protato opens itself, not just the console
+                startupinfo = subprocess.STARTUPINFO()
+                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+                startupinfo.wShowWindow = subprocess.SW_HIDE
+                
+                # Feed Protato a newline for its "press Enter" prompt; its output is only
+                # piped when someone will read it, otherwise the OS discards it
+                relay = callback is not None or self.debug
+                proc = self._protato_proc = subprocess.Popen(
+                    [self.protato_exe],
                     cwd=self.protato_dir,
-                    timeout=30,  # 30 second timeout
-                    creationflags=subprocess.CREATE_NO_WINDOW,
-                    capture_output=True,
-                    text=True
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE if relay else subprocess.DEVNULL,
+                    stderr=subprocess.STDOUT,
+                    bufsize=65536,
+                    creationflags=subprocess.CREATE_NO_WINDOW | subprocess.DETACHED_PROCESS,
+                    startupinfo=startupinfo
                 )
+                # Kill and reap a hung instance so it never holds file locks into the next run
+                watchdog = threading.Timer(self.timeout, proc.kill)
+                watchdog.start()
+                try:
+                    try:
+                        proc.stdin.write(b"\r\n")
+                        proc.stdin.close()
+                    except BrokenPipeError:
+                        pass
+                    for line in iter(proc.stdout.readline, b'') if relay else ():
+                        line = line.decode(errors='ignore').strip()
+                        if not line:
+                            continue
+                        if self.debug:
+                            self.logger.info("Protato: %s", line)
+                        if callback:
+                            callback(line)
+                    proc.wait()
+                    timed_out = watchdog.finished.is_set()
+                finally:
+                    watchdog.cancel()
+                    if relay:
+                        proc.stdout.close()
+                if timed_out or self._protato_proc is not proc:
+                    # Killed before finishing (timeout or close()), so its output is incomplete
+                    if callback:
+                        callback("Protato timed out and was stopped" if timed_out else "Protato was stopped")
+                    return False
                 
                 if callback:
                     callback("Silent Protato execution completed")
@@ -672,62 +757,121 @@ exit /b 0
                 return True
                 
             finally:
-                # Always clean up batch file
-                if os.path.exists(batch_file):
-                    try:
-                        os.remove(batch_file)
-                    except:
-                        pass  # Ignore cleanup errors
+                self._protato_proc = None
+                # Protato may have written new files, so forget cached listings
+                self._dir_cache.clear()
                     
-        except subprocess.TimeoutExpired:
-            if callback:
-                callback("Protato processing completed (timeout is normal)")
-            return True  # Timeout is often expected with Protato
         except Exception as e:
             if callback:
                 callback(f"Silent execution failed: {str(e)}")
             return False
 
+# Bound on first use by ProtatoProgressDialog so importing this module does not load tkinter
+tk = None
+ttk = None
 
 class ProtatoProgressDialog:
     """Progress dialog for Protato operations"""
     
     def __init__(self, parent, title="Protato Operation"):
+        # tkinter is loaded by the first dialog only, then reused from module scope
+        global tk, ttk
+        if ttk is None:
+            import tkinter as tk
+            from tkinter import ttk
+        
         self.parent = parent
         self.dialog = tk.Toplevel(parent)
         self.dialog.title(title)
-        self.dialog.geometry("400x150")
+        # Size and center the dialog in one call; the size is fixed, so only the screen is queried
+        x = (self.dialog.winfo_screenwidth() - 400) // 2
+        y = (self.dialog.winfo_screenheight() - 150) // 2
+        self.dialog.geometry(f"400x150+{x}+{y}")
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
-        # Center the dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (self.dialog.winfo_width() // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (self.dialog.winfo_height() // 2)
-        self.dialog.geometry(f"+{x}+{y}")
-        
         # Progress label
         self.status_var = tk.StringVar()
         self.status_label = tk.Label(self.dialog, textvariable=self.status_var, wraplength=350)
         self.status_label.pack(pady=20)
         
         # Progress bar
-        from tkinter import ttk
         self.progress = ttk.Progressbar(self.dialog, mode='indeterminate')
         self.progress.pack(fill=tk.X, padx=20, pady=10)
         self.progress.start()
+        # Pause the animation while minimized so it does not redraw every 50 ms unseen
+        self.dialog.bind('<Unmap>', self._on_unmap)
+        self.dialog.bind('<Map>', self._on_map)
         
         # Cancel button (optional)
         self.cancel_button = tk.Button(self.dialog, text="Cancel", command=self.cancel)
         self.cancel_button.pack(pady=10)
         
         self.cancelled = False
+        self._destroyed = False
         self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
+        
+        # Status messages may come from worker threads; the Tk thread drains them
+        self._messages = queue.Queue()
+        self._poll_id = self.dialog.after(50, self._drain_messages)
+    
+    def reset(self, title, status=""):
+        """Retitle the dialog and clear its state for the next item, without rebuilding it"""
+        self.dialog.title(title)
+        self.status_var.set(status)
+        self.cancelled = False
+    
+    def show(self, title):
+        """Show the dialog again for a new operation"""
+        self.reset(title)
+        self.dialog.deiconify()
+        self.dialog.grab_set()
+        self.progress.start()
+        if self._poll_id is None:
+            self._poll_id = self.dialog.after(50, self._drain_messages)
+    
+    def hide(self):
+        """Hide the dialog so it can be reused by the next operation"""
+        self._stop_polling()
+        self.progress.stop()
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+    
+    def _on_unmap(self, event):
+        """Stop the progress animation when the dialog is minimized or hidden"""
+        if event.widget is self.dialog:
+            self.progress.stop()
+    
+    def _on_map(self, event):
+        """Restart the progress animation when the dialog is shown again"""
+        if event.widget is self.dialog:
+            self.progress.start()
     
     def update_status(self, message):
-        """Update the status message"""
-        self.status_var.set(message)
-        self.dialog.update()
+        """Update the status message (safe to call from any thread)"""
+        self._messages.put(message)
+    
+    def _drain_messages(self):
+        """Show the newest queued status message, then poll again (runs on the Tk thread)"""
+        message = None
+        try:
+            while True:
+                message = self._messages.get_nowait()
+        except queue.Empty:
+            pass
+        
+        if message is not None:
+            self.status_var.set(message)
+            # Only flush pending redraws - a full update() would re-enter the event loop
+            self.status_label.update_idletasks()
+        self._poll_id = self.dialog.after(50, self._drain_messages)
+    
+    def _stop_polling(self):
+        """Stop draining status messages and drop any still queued"""
+        if self._poll_id is not None:
+            self.dialog.after_cancel(self._poll_id)
+            self._poll_id = None
+        self._messages = queue.Queue()
     
     def cancel(self):
         """Cancel the operation"""
@@ -736,13 +880,20 @@ class ProtatoProgressDialog:
     
     def close(self):
         """Close the dialog"""
+        if self._destroyed:
+            return
         try:
+            self._stop_polling()
             self.progress.stop()
-            if self.dialog.winfo_exists():
-                self.dialog.destroy()
+            self.dialog.destroy()
         except:
             pass  # Dialog might already be closed
+        self._destroyed = True
     
     def is_cancelled(self):
         """Check if operation was cancelled"""
-        return self.cancelled
\ No newline at end of file
+        return self.cancelled
+    
+    def is_closed(self):
+        """Check if the dialog was closed"""
+        return self._destroyed
\ No newline at end of file
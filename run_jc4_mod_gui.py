@@ -9,31 +9,37 @@ import os
 # Add current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Printed as one write - each print() is a separate console write on Windows
+BANNER = (
+    "Starting JC4 Mod Maker GUI...\n"
+    "\n"
+    "🔇 COMPLETELY SILENT PROTATO INTEGRATION!\n"
+    "✅ Hidden Protato process - No GUI popups guaranteed\n"
+    "✅ Real Protato processing with 300+ files per vehicle\n"
+    "✅ Automatic file cleanup - No leftover EE files\n"
+    "✅ Complete game compatibility - Vehicles spawn correctly\n"
+    "\n"
+    "🎯 SILENT WORKFLOW:\n"
+    "1. Select Vehicle → 2. Silent Protato EE→XML → 3. Edit Performance →\n"
+    "4. Silent Protato XML→EE → 5. 🚀 Deploy → 6. 🎮 Works in Game!\n"
+    "\n"
+    "🔧 Technical Features:\n"
+    "- Protato runs as a hidden background process\n"
+    "- Enhanced cleanup removes all temporary files\n"
+    "- Real XML filtering shows only vehicle_misc for editing\n"
+    "- Authentic EE file generation preserves all game data\n"
+    "- Visual progress feedback with green highlighting\n"
+    "- Automatic backups protect original files\n"
+    "\n"
+    "▶️ Ready to launch - No Protato windows will appear!\n"
+    "\n"
+)
+
 try:
     from jc4_mod_gui import main
     
-    print("Starting JC4 Mod Maker GUI...")
-    print("")
-    print("🔇 COMPLETELY SILENT PROTATO INTEGRATION!")
-    print("✅ Method 1: Batch File Wrapper - No GUI popups guaranteed")
-    print("✅ Real Protato processing with 300+ files per vehicle")
-    print("✅ Automatic file cleanup - No leftover EE files")
-    print("✅ Complete game compatibility - Vehicles spawn correctly")
-    print("")
-    print("🎯 SILENT WORKFLOW:")
-    print("1. Select Vehicle → 2. Silent Protato EE→XML → 3. Edit Performance →")
-    print("4. Silent Protato XML→EE → 5. 🚀 Deploy → 6. 🎮 Works in Game!")
-    print("")
-    print("🔧 Technical Features:")
-    print("- Batch wrapper runs Protato completely hidden")
-    print("- Enhanced cleanup removes all temporary files")
-    print("- Real XML filtering shows only vehicle_misc for editing")
-    print("- Authentic EE file generation preserves all game data")
-    print("- Visual progress feedback with green highlighting")
-    print("- Automatic backups protect original files")
-    print("")
-    print("▶️ Ready to launch - No Protato windows will appear!")
-    print("")
+    sys.stdout.write(BANNER)
+    sys.stdout.flush()
     
     main()
 